@@ -1,25 +1,42 @@
 """The CUPS integration."""
+import asyncio
 import logging
 from datetime import timedelta
 from typing import Any
 
-from pyipp import IPP, IPPError
+import aiohttp
+from pyipp import IPP, IPPError, Printer
+from pyipp.enums import IppOperation
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SSL, CONF_VERIFY_SSL, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.service import async_extract_config_entry_ids
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
+    ACTIVE_UPDATE_INTERVAL,
+    CONF_ACTIVE_INTERVAL,
     CONF_BASE_PATH,
+    CONF_IDLE_INTERVAL,
     DEFAULT_BASE_PATH,
     DEFAULT_PORT,
     DEFAULT_SSL,
     DEFAULT_VERIFY_SSL,
     DOMAIN,
+    IDLE_UPDATE_INTERVAL,
+    JOB_COUNT_LIMIT,
+    MARKER_ATTRIBUTES,
+    NOTIFY_EVENTS,
+    NOTIFY_LEASE_DURATION,
+    PRINTER_ATTRIBUTES,
+    PRINTER_STATE_IDLE,
+    PRINTER_STATE_PROCESSING,
+    PUSH_UPDATE_INTERVAL,
     SERVICE_CANCEL_ALL_JOBS,
     SERVICE_CANCEL_JOB,
     SERVICE_PAUSE_JOB,
@@ -28,7 +45,7 @@ from .const import (
     SERVICE_RESUME_PRINTER,
     UPDATE_INTERVAL,
 )
-from .ipp_operations import IPPOperations
+from .ipp_operations import IPP_STATUS_NOT_FOUND, IPPOperationError, IPPOperations
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,34 +56,58 @@ SERVICE_JOB_SCHEMA = vol.Schema(
     {
         vol.Required("job_id"): cv.positive_int,
     }
-)
+).extend(cv.ENTITY_SERVICE_FIELDS)
+
+# Service name -> (IPPOperations method, action for logs, takes a job ID)
+SERVICES = {
+    SERVICE_PAUSE_PRINTER: ("pause_printer", "pause", False),
+    SERVICE_RESUME_PRINTER: ("resume_printer", "resume", False),
+    SERVICE_CANCEL_ALL_JOBS: ("purge_jobs", "cancel all jobs on", False),
+    SERVICE_PAUSE_JOB: ("hold_job", "pause", True),
+    SERVICE_RESUME_JOB: ("release_job", "resume", True),
+    SERVICE_CANCEL_JOB: ("cancel_job", "cancel", True),
+}
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up CUPS from a config entry."""
-    session = async_get_clientsession(
-        hass, verify_ssl=entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
-    )
+    host = entry.data[CONF_HOST]
+    port = entry.data.get(CONF_PORT, DEFAULT_PORT)
+    base_path = entry.data.get(CONF_BASE_PATH, DEFAULT_BASE_PATH)
+    tls = entry.data.get(CONF_SSL, DEFAULT_SSL)
+    verify_ssl = entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
+
+    # One pooled session serves both pyipp polling and job management, so
+    # service calls reuse the keep-alive connections of the coordinator
+    session = async_get_clientsession(hass, verify_ssl=verify_ssl)
 
     ipp = IPP(
-        host=entry.data[CONF_HOST],
-        port=entry.data.get(CONF_PORT, DEFAULT_PORT),
-        base_path=entry.data.get(CONF_BASE_PATH, DEFAULT_BASE_PATH),
-        tls=entry.data.get(CONF_SSL, DEFAULT_SSL),
+        host=host,
+        port=port,
+        base_path=base_path,
+        tls=tls,
         session=session,
     )
 
-    coordinator = CUPSDataUpdateCoordinator(hass, ipp)
-    await coordinator.async_config_entry_first_refresh()
-
     # Create IPP operations handler for job management
     ipp_ops = IPPOperations(
         session=session,
-        host=entry.data[CONF_HOST],
-        port=entry.data.get(CONF_PORT, DEFAULT_PORT),
-        base_path=entry.data.get(CONF_BASE_PATH, DEFAULT_BASE_PATH),
-        tls=entry.data.get(CONF_SSL, DEFAULT_SSL),
+        host=host,
+        port=port,
+        base_path=base_path,
+        tls=tls,
+    )
+
+    coordinator = CUPSDataUpdateCoordinator(
+        hass,
+        ipp,
+        ipp_ops,
+        active_interval=entry.options.get(
+            CONF_ACTIVE_INTERVAL, ACTIVE_UPDATE_INTERVAL
+        ),
+        idle_interval=entry.options.get(CONF_IDLE_INTERVAL, IDLE_UPDATE_INTERVAL),
     )
+    await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
@@ -77,118 +118,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services
-    async def handle_pause_printer(call: ServiceCall) -> None:
-        """Handle pause printer service call."""
-        _LOGGER.info("Pause printer service called for %s", entry.title)
-        success = await ipp_ops.pause_printer()
-        if success:
-            _LOGGER.info("Successfully paused printer %s", entry.title)
-            # Request coordinator refresh to update status
-            await coordinator.async_request_refresh()
-        else:
-            _LOGGER.error("Failed to pause printer %s", entry.title)
-
-    async def handle_resume_printer(call: ServiceCall) -> None:
-        """Handle resume printer service call."""
-        _LOGGER.info("Resume printer service called for %s", entry.title)
-        success = await ipp_ops.resume_printer()
-        if success:
-            _LOGGER.info("Successfully resumed printer %s", entry.title)
-            # Request coordinator refresh to update status
-            await coordinator.async_request_refresh()
-        else:
-            _LOGGER.error("Failed to resume printer %s", entry.title)
-
-    async def handle_cancel_all_jobs(call: ServiceCall) -> None:
-        """Handle cancel all jobs service call."""
-        _LOGGER.info("Cancel all jobs service called for %s", entry.title)
-        success = await ipp_ops.purge_jobs()
-        if success:
-            _LOGGER.info("Successfully cancelled all jobs on printer %s", entry.title)
-            # Request coordinator refresh to update queue
-            await coordinator.async_request_refresh()
-        else:
-            _LOGGER.error("Failed to cancel all jobs on printer %s", entry.title)
-
-    async def handle_pause_job(call: ServiceCall) -> None:
-        """Handle pause job service call."""
-        job_id = call.data.get("job_id")
-        _LOGGER.info("Pause job %s service called for %s", job_id, entry.title)
-        success = await ipp_ops.hold_job(job_id)
-        if success:
-            _LOGGER.info(
-                "Successfully paused job %s on printer %s", job_id, entry.title
-            )
-            # Request coordinator refresh to update queue
-            await coordinator.async_request_refresh()
-        else:
-            _LOGGER.error(
-                "Failed to pause job %s on printer %s", job_id, entry.title
-            )
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
-    async def handle_resume_job(call: ServiceCall) -> None:
-        """Handle resume job service call."""
-        job_id = call.data.get("job_id")
-        _LOGGER.info("Resume job %s service called for %s", job_id, entry.title)
-        success = await ipp_ops.release_job(job_id)
-        if success:
-            _LOGGER.info(
-                "Successfully resumed job %s on printer %s", job_id, entry.title
-            )
-            # Request coordinator refresh to update queue
-            await coordinator.async_request_refresh()
-        else:
-            _LOGGER.error(
-                "Failed to resume job %s on printer %s", job_id, entry.title
-            )
+    # Prefer printer/job events over polling when the server supports them
+    coordinator.async_start_event_listener(entry)
 
-    async def handle_cancel_job(call: ServiceCall) -> None:
-        """Handle cancel job service call."""
-        job_id = call.data.get("job_id")
-        _LOGGER.info("Cancel job %s service called for %s", job_id, entry.title)
-        success = await ipp_ops.cancel_job(job_id)
-        if success:
-            _LOGGER.info(
-                "Successfully cancelled job %s on printer %s", job_id, entry.title
-            )
-            # Request coordinator refresh to update queue
-            await coordinator.async_request_refresh()
-        else:
-            _LOGGER.error(
-                "Failed to cancel job %s on printer %s", job_id, entry.title
-            )
-
-    # Register services only once
-    if not hass.services.has_service(DOMAIN, SERVICE_PAUSE_PRINTER):
-        hass.services.async_register(
-            DOMAIN, SERVICE_PAUSE_PRINTER, handle_pause_printer
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_RESUME_PRINTER):
-        hass.services.async_register(
-            DOMAIN, SERVICE_RESUME_PRINTER, handle_resume_printer
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_CANCEL_ALL_JOBS):
-        hass.services.async_register(
-            DOMAIN, SERVICE_CANCEL_ALL_JOBS, handle_cancel_all_jobs
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_PAUSE_JOB):
-        hass.services.async_register(
-            DOMAIN, SERVICE_PAUSE_JOB, handle_pause_job, schema=SERVICE_JOB_SCHEMA
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_RESUME_JOB):
-        hass.services.async_register(
-            DOMAIN, SERVICE_RESUME_JOB, handle_resume_job, schema=SERVICE_JOB_SCHEMA
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_CANCEL_JOB):
-        hass.services.async_register(
-            DOMAIN, SERVICE_CANCEL_JOB, handle_cancel_job, schema=SERVICE_JOB_SCHEMA
-        )
+    # Services are shared by all entries, register them with the first one
+    if len(hass.data[DOMAIN]) == 1:
+        _async_register_services(hass)
 
     return True
 
@@ -198,24 +135,85 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["coordinator"].async_stop_event_listener()
 
         # Unregister services if this is the last entry
         if not hass.data[DOMAIN]:
-            hass.services.async_remove(DOMAIN, SERVICE_PAUSE_PRINTER)
-            hass.services.async_remove(DOMAIN, SERVICE_RESUME_PRINTER)
-            hass.services.async_remove(DOMAIN, SERVICE_CANCEL_ALL_JOBS)
-            hass.services.async_remove(DOMAIN, SERVICE_PAUSE_JOB)
-            hass.services.async_remove(DOMAIN, SERVICE_RESUME_JOB)
-            hass.services.async_remove(DOMAIN, SERVICE_CANCEL_JOB)
+            for service in SERVICES:
+                hass.services.async_remove(DOMAIN, service)
 
     return unload_ok
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _is_transport_error(err: IPPOperationError) -> bool:
+    """Return whether an IPP request failed with an HTTP error or timeout."""
+    return isinstance(err.__cause__, (asyncio.TimeoutError, aiohttp.ClientError))
+
+
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the CUPS services."""
+
+    async def handle_service(call: ServiceCall) -> None:
+        """Run a printer or job operation on the targeted printers."""
+        method, action, takes_job_id = SERVICES[call.service]
+        args = (call.data["job_id"],) if takes_job_id else ()
+
+        entry_ids = await async_extract_config_entry_ids(hass, call)
+        entries = hass.data[DOMAIN]
+        if entry_ids:
+            entry_ids = entry_ids.intersection(entries)
+        elif takes_job_id and len(entries) > 1:
+            # Job IDs are per server, the same number is another job elsewhere
+            raise HomeAssistantError(
+                f"Select the printer that job {args[0]} belongs to"
+            )
+        else:
+            # Without a target, apply to every configured printer
+            entry_ids = set(entries)
+
+        for entry_id in entry_ids:
+            ipp_ops = entries[entry_id]["ipp_ops"]
+            coordinator = entries[entry_id]["coordinator"]
+            target = f"printer {coordinator.config_entry.title}"
+            if takes_job_id:
+                target = f"job {args[0]} on {target}"
+
+            _LOGGER.info("Service called to %s %s", action, target)
+            success = await getattr(ipp_ops, method)(*args)
+            if success:
+                _LOGGER.info("Successfully ran %s %s", action, target)
+                # Refresh status and queue without holding up the service call
+                hass.async_create_task(coordinator.async_request_refresh())
+            else:
+                _LOGGER.error("Failed to %s %s", action, target)
+
+    for service, (_, _, takes_job_id) in SERVICES.items():
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handle_service,
+            schema=SERVICE_JOB_SCHEMA if takes_job_id else None,
+        )
+
+
 class CUPSDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching CUPS printer data."""
 
-    def __init__(self, hass: HomeAssistant, ipp: IPP) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ipp: IPP,
+        ipp_ops: IPPOperations,
+        active_interval: int = ACTIVE_UPDATE_INTERVAL,
+        idle_interval: int = IDLE_UPDATE_INTERVAL,
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
@@ -224,21 +222,174 @@ class CUPSDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
         )
         self.ipp = ipp
+        self.ipp_ops = ipp_ops
+        self._marker_listener_count = 0
+        # Poll fast while printing, slowly while idle, default otherwise
+        self._state_intervals = {
+            PRINTER_STATE_PROCESSING: timedelta(seconds=active_interval),
+            PRINTER_STATE_IDLE: timedelta(seconds=idle_interval),
+        }
+        self._default_interval = timedelta(seconds=UPDATE_INTERVAL)
+        self._event_task: asyncio.Task | None = None
+        self._subscription_id: int | None = None
+        self._device_identity: tuple | None = None
+        self.device_info_cache: dict[str, Any] | None = None
+
+    @callback
+    def async_add_marker_listener(self) -> None:
+        """Register an enabled marker sensor."""
+        self._marker_listener_count += 1
+
+    @callback
+    def async_remove_marker_listener(self) -> None:
+        """Unregister a marker sensor."""
+        self._marker_listener_count -= 1
+
+    @callback
+    def async_start_event_listener(self, entry: ConfigEntry) -> None:
+        """Start listening for printer events in the background."""
+        self._event_task = entry.async_create_background_task(
+            self.hass,
+            self._async_listen_for_events(),
+            f"{DOMAIN} event listener {entry.title}",
+        )
+
+    async def async_stop_event_listener(self) -> None:
+        """Stop listening for printer events and drop the subscription."""
+        if self._event_task is not None:
+            self._event_task.cancel()
+            self._event_task = None
+
+        if self._subscription_id is not None:
+            await self.ipp_ops.cancel_subscription(self._subscription_id)
+            self._subscription_id = None
+
+    async def _async_listen_for_events(self) -> None:
+        """Refresh on printer and job events from an ippget subscription."""
+        while True:
+            try:
+                self._subscription_id = (
+                    await self.ipp_ops.create_printer_subscription(
+                        NOTIFY_EVENTS, NOTIFY_LEASE_DURATION
+                    )
+                )
+            except IPPOperationError as err:
+                if not _is_transport_error(err):
+                    # Subscriptions are not supported, keep polling
+                    _LOGGER.debug("Printer events unavailable: %s", err)
+                    return
+                await asyncio.sleep(UPDATE_INTERVAL)
+                continue
+
+            _LOGGER.debug(
+                "Subscribed to printer events (id %s)", self._subscription_id
+            )
+            sequence_number = 1
+
+            while True:
+                try:
+                    events, interval = await self.ipp_ops.get_notifications(
+                        self._subscription_id, sequence_number
+                    )
+                except IPPOperationError as err:
+                    if _is_transport_error(err):
+                        # HTTP error or timeout, the subscription itself is
+                        # still live on the server, so keep polling it
+                        _LOGGER.debug("Failed to fetch printer events: %s", err)
+                        self.update_interval = self._default_interval
+                        await asyncio.sleep(UPDATE_INTERVAL)
+                        continue
+
+                    _LOGGER.debug("Lost printer event subscription: %s", err)
+                    subscription_id, self._subscription_id = self._subscription_id, None
+                    self.update_interval = self._default_interval
+                    if err.status_code != IPP_STATUS_NOT_FOUND:
+                        # Don't leave it on the server until its lease expires
+                        await self.ipp_ops.cancel_subscription(subscription_id)
+                        await asyncio.sleep(UPDATE_INTERVAL)
+                    break
+
+                # Events replace the state-based polling interval
+                self.update_interval = timedelta(seconds=PUSH_UPDATE_INTERVAL)
+
+                if events:
+                    sequence_number = 1 + max(
+                        event.get("notify-sequence-number", 0) for event in events
+                    )
+                    await self.async_request_refresh()
+                    continue
+
+                await asyncio.sleep(interval or UPDATE_INTERVAL)
+
+    def _update_device_info(self, printer: Printer) -> None:
+        """Rebuild the shared device info when the printer identity changes."""
+        info = printer.info
+        identity = (
+            info.name,
+            info.manufacturer,
+            info.model,
+            info.version,
+            tuple(info.printer_uri_supported or ()),
+        )
+        if identity == self._device_identity:
+            return
+
+        self._device_identity = identity
+        self.device_info_cache = {
+            "identifiers": {(DOMAIN, self.config_entry.entry_id)},
+            "name": info.name or self.config_entry.title,
+            # pyipp already splits the make off printer-make-and-model
+            "manufacturer": info.manufacturer or "Unknown",
+            "model": info.model or "Unknown",
+            "sw_version": info.version,
+            "configuration_url": (
+                info.printer_uri_supported[0] if info.printer_uri_supported else None
+            ),
+        }
+
+    async def _async_fetch_printer(self) -> Printer:
+        """Fetch only the printer attributes the entities consume."""
+        if self.data is None:
+            # First refresh: fetch everything so marker sensors can be discovered
+            return await self.ipp.printer()
+
+        attributes = PRINTER_ATTRIBUTES
+        if self._marker_listener_count:
+            attributes = PRINTER_ATTRIBUTES + MARKER_ATTRIBUTES
+
+        response = await self.ipp.execute(
+            IppOperation.GET_PRINTER_ATTRIBUTES,
+            {
+                "operation-attributes-tag": {
+                    "requested-attributes": attributes,
+                },
+            },
+        )
+
+        return Printer.from_dict(next(iter(response["printers"] or []), {}))
 
     async def _async_update_data(self):
         """Fetch data from IPP."""
-        try:
-            printer = await self.ipp.printer()
+        # Entities are all disabled or removed, keep the last data
+        if self.data is not None and not self._listeners:
+            return self.data
 
-            _LOGGER.debug(
-                "Fetched printer data: %s (state: %s)",
-                printer.info.name,
-                printer.state.printer_state,
+        try:
+            printer, active_jobs = await asyncio.gather(
+                self._async_fetch_printer(),
+                self.ipp_ops.get_active_job_count(JOB_COUNT_LIMIT),
             )
 
-            # Log marker levels for debugging
-            if printer.markers:
-                for marker in printer.markers:
+            # Skip walking the markers entirely unless debug logging is on
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Fetched printer data: %s (state: %s)",
+                    printer.info.name,
+                    printer.state.printer_state,
+                )
+
+                # Log marker levels for debugging
+                for marker in printer.markers or ():
                     _LOGGER.debug(
                         "Marker: %s (%s %s) - Level: %s%%",
                         marker.name,
@@ -247,11 +398,17 @@ class CUPSDataUpdateCoordinator(DataUpdateCoordinator):
                         marker.level,
                     )
 
+            self._update_device_info(printer)
+
+            if self._subscription_id is None:
+                self.update_interval = self._state_intervals.get(
+                    printer.state.printer_state, self._default_interval
+                )
+
             return {
                 "printer": printer,
+                "active_jobs": active_jobs,
             }
 
-        except IPPError as err:
+        except (IPPError, asyncio.TimeoutError, aiohttp.ClientError) as err:
             raise UpdateFailed(f"Error communicating with printer: {err}") from err
-        except Exception as err:
-            raise UpdateFailed(f"Unexpected error: {err}") from err
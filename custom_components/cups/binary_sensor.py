@@ -1,5 +1,6 @@
 """Support for CUPS binary sensors."""
 import logging
+import re
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -20,6 +21,11 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# State reasons that mean the printer is unreachable
+OFFLINE_REASONS_RE = re.compile(
+    "connecting-to-device|offline-report|shutdown", re.IGNORECASE
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -53,26 +59,7 @@ class CUPSBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
     @property
     def device_info(self):
         """Return device information."""
-        printer = self.coordinator.data.get("printer")
-        if not printer:
-            return None
-
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": printer.info.name or self._entry.title,
-            "manufacturer": (
-                printer.info.make_and_model.split()[0]
-                if printer.info.make_and_model
-                else "Unknown"
-            ),
-            "model": printer.info.make_and_model or "Unknown",
-            "sw_version": printer.info.printer_firmware_string_version,
-            "configuration_url": (
-                printer.info.printer_uri_supported[0]
-                if printer.info.printer_uri_supported
-                else None
-            ),
-        }
+        return self.coordinator.device_info_cache
 
 
 class CUPSConnectivitySensor(CUPSBinarySensorBase):
@@ -96,15 +83,11 @@ class CUPSConnectivitySensor(CUPSBinarySensorBase):
         # Printer is considered offline if state is STOPPED and has specific reasons
         if printer.state.printer_state == PRINTER_STATE_STOPPED:
             # Check if stopped due to connectivity issues
-            reasons = printer.state.printer_state_reasons or []
-            offline_reasons = [
-                "connecting-to-device",
-                "offline-report",
-                "shutdown",
-            ]
-            for reason in reasons:
-                if any(offline in reason.lower() for offline in offline_reasons):
-                    return False
+            reasons = printer.state.reasons or []
+            if not isinstance(reasons, str):
+                reasons = " ".join(reasons)
+            if OFFLINE_REASONS_RE.search(reasons):
+                return False
 
         # If we can get printer data, it's online
         return True
@@ -1,18 +1,24 @@
 """Config flow for CUPS integration."""
+import asyncio
 import logging
 from typing import Any
 
-import voluptuous as vol
+import aiohttp
 from pyipp import IPP, IPPError
+import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SSL, CONF_VERIFY_SSL
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
+    ACTIVE_UPDATE_INTERVAL,
+    CONF_ACTIVE_INTERVAL,
     CONF_BASE_PATH,
+    CONF_IDLE_INTERVAL,
     DEFAULT_BASE_PATH,
     DEFAULT_PORT,
     DEFAULT_SSL,
@@ -21,10 +27,25 @@ from .const import (
     ERROR_CANNOT_CONNECT,
     ERROR_INVALID_HOST,
     ERROR_UNKNOWN,
+    IDLE_UPDATE_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+        vol.Optional(CONF_SSL, default=DEFAULT_SSL): bool,
+        vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool,
+        vol.Optional(CONF_BASE_PATH, default=DEFAULT_BASE_PATH): str,
+    }
+)
+
+
+class CannotConnect(HomeAssistantError):
+    """Error to indicate we cannot connect."""
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
@@ -38,7 +59,10 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         session=session,
     )
 
-    printer_info = await ipp.printer()
+    try:
+        printer_info = await ipp.printer()
+    except IPPError as err:
+        raise CannotConnect(str(err)) from err
 
     return {
         "title": printer_info.info.name or data[CONF_HOST],
@@ -55,6 +79,7 @@ class CUPSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Initialize the config flow."""
         self._discovery_info = None
+        self._discovery_info_result = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -76,7 +101,7 @@ class CUPSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=user_input,
                 )
 
-            except IPPError:
+            except CannotConnect:
                 errors["base"] = ERROR_CANNOT_CONNECT
                 _LOGGER.error("Cannot connect to CUPS/IPP server")
             except Exception as err:  # pylint: disable=broad-except
@@ -85,15 +110,7 @@ class CUPSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST): str,
-                    vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
-                    vol.Optional(CONF_SSL, default=DEFAULT_SSL): bool,
-                    vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool,
-                    vol.Optional(CONF_BASE_PATH, default=DEFAULT_BASE_PATH): str,
-                }
-            ),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
@@ -120,6 +137,7 @@ class CUPSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         try:
             info = await validate_input(self.hass, self._discovery_info)
+            self._discovery_info_result = info
 
             # Set unique ID and abort if already configured
             if info.get("printer_uri"):
@@ -130,18 +148,21 @@ class CUPSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             return await self.async_step_zeroconf_confirm()
 
-        except (IPPError, Exception) as err:
+        except CannotConnect as err:
             _LOGGER.error("Error during zeroconf setup: %s", err)
             return self.async_abort(reason=ERROR_CANNOT_CONNECT)
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.error("Connection error during zeroconf setup: %s", err)
+            return self.async_abort(reason=ERROR_CANNOT_CONNECT)
 
     async def async_step_zeroconf_confirm(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Confirm zeroconf discovery."""
         if user_input is not None:
-            info = await validate_input(self.hass, self._discovery_info)
+            # The printer was validated when it was discovered
             return self.async_create_entry(
-                title=info["title"],
+                title=self._discovery_info_result["title"],
                 data=self._discovery_info,
             )
 
@@ -197,6 +218,18 @@ class CUPSOptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_BASE_PATH, DEFAULT_BASE_PATH
                         ),
                     ): str,
+                    vol.Optional(
+                        CONF_ACTIVE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_ACTIVE_INTERVAL, ACTIVE_UPDATE_INTERVAL
+                        ),
+                    ): vol.All(int, vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_IDLE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_IDLE_INTERVAL, IDLE_UPDATE_INTERVAL
+                        ),
+                    ): vol.All(int, vol.Range(min=1)),
                 }
             ),
         )
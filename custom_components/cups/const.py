@@ -1,9 +1,13 @@
 """Constants for the CUPS integration."""
+import sys
+from types import MappingProxyType
 
 DOMAIN = "cups"
 
 # Configuration constants not in homeassistant.const
 CONF_BASE_PATH = "base_path"
+CONF_ACTIVE_INTERVAL = "active_interval"
+CONF_IDLE_INTERVAL = "idle_interval"
 
 # Default values
 DEFAULT_PORT = 631
@@ -13,17 +17,52 @@ DEFAULT_BASE_PATH = "/ipp/print"
 
 # Update interval
 UPDATE_INTERVAL = 30  # seconds
+ACTIVE_UPDATE_INTERVAL = 5  # seconds, while the printer is processing
+IDLE_UPDATE_INTERVAL = 60  # seconds, while the printer is idle
+PUSH_UPDATE_INTERVAL = 300  # seconds, keepalive while event notifications work
+
+# Maximum number of pending jobs fetched for the queue sensor
+JOB_COUNT_LIMIT = 100
+
+# Event notifications (RFC 3995 ippget pull subscriptions)
+NOTIFY_EVENTS = ["printer-state-changed", "job-state-changed", "job-completed"]
+NOTIFY_LEASE_DURATION = 86400  # seconds
+
+# IPP attributes requested on each poll, limited to what the entities use
+PRINTER_ATTRIBUTES = [
+    "printer-device-id",
+    "printer-name",
+    "printer-make-and-model",
+    "printer-location",
+    "printer-info",
+    "printer-state",
+    "printer-state-message",
+    "printer-state-reasons",
+    "printer-up-time",
+    "printer-uri-supported",
+    "printer-firmware-string-version",
+]
+
+# Marker attributes, only requested while a marker sensor is enabled
+MARKER_ATTRIBUTES = [
+    "marker-colors",
+    "marker-high-levels",
+    "marker-levels",
+    "marker-low-levels",
+    "marker-names",
+    "marker-types",
+]
 
 # Platforms
 PLATFORMS = ["sensor", "binary_sensor"]
 
-# Printer states (IPP)
-PRINTER_STATE_IDLE = 3
-PRINTER_STATE_PROCESSING = 4
-PRINTER_STATE_STOPPED = 5
+# Printer states, as pyipp names the IPP printer-state values 3, 4 and 5
+PRINTER_STATE_IDLE = "idle"
+PRINTER_STATE_PROCESSING = "printing"
+PRINTER_STATE_STOPPED = "stopped"
 
-# Printer state reasons
-PRINTER_STATE_REASONS = {
+# Printer state reasons (read-only, with interned keyword keys)
+_PRINTER_STATE_REASONS = {
     "none": "No issues",
     "other": "Unknown issue",
     "media-needed": "Media needed",
@@ -41,6 +80,9 @@ PRINTER_STATE_REASONS = {
     "door-open": "Door open",
     "cover-open": "Cover open",
 }
+PRINTER_STATE_REASONS = MappingProxyType(
+    {sys.intern(key): value for key, value in _PRINTER_STATE_REASONS.items()}
+)
 
 # Marker types
 MARKER_TYPE_TONER = "toner"
@@ -1,5 +1,8 @@
 """IPP operations for CUPS integration."""
+import asyncio
 import logging
+import random
+import struct
 from typing import Any
 
 import aiohttp
@@ -14,6 +17,9 @@ IPP_OP_HOLD_JOB = 0x000C
 IPP_OP_RELEASE_JOB = 0x000D
 IPP_OP_CANCEL_JOB = 0x0008
 IPP_OP_GET_JOBS = 0x000A
+IPP_OP_CREATE_PRINTER_SUBSCRIPTIONS = 0x0016
+IPP_OP_CANCEL_SUBSCRIPTION = 0x001B
+IPP_OP_GET_NOTIFICATIONS = 0x001C
 
 # IPP version
 IPP_VERSION_1_1 = (1, 1)
@@ -21,17 +27,75 @@ IPP_VERSION_2_0 = (2, 0)
 
 # IPP tags
 IPP_TAG_OPERATION = 0x01
+IPP_TAG_JOB = 0x02
 IPP_TAG_END = 0x03
+IPP_TAG_SUBSCRIPTION = 0x06
+IPP_TAG_EVENT_NOTIFICATION = 0x07
 IPP_TAG_URI = 0x45
 IPP_TAG_INTEGER = 0x21
+IPP_TAG_BOOLEAN = 0x22
+IPP_TAG_ENUM = 0x23
 IPP_TAG_CHARSET = 0x47
 IPP_TAG_LANGUAGE = 0x48
 IPP_TAG_NAME = 0x42
+IPP_TAG_KEYWORD = 0x44
+
+# Delimiter tags (0x00-0x0F) start a new attribute group in a response
+IPP_TAG_MAX_DELIMITER = 0x0F
+
+# Value tags decoded as strings (textWithoutLanguage .. mimeMediaType)
+IPP_STRING_TAGS = frozenset(range(0x41, 0x4A))
+
+# IPP status codes
+IPP_STATUS_NOT_FOUND = 0x0406
+
+# Wire formats: request header (version, operation ID, request ID), attribute
+# header (value tag, name length), value length, and fixed-size values
+_HDR = struct.Struct(">HHI")
+_ATTR_HDR = struct.Struct(">BH")
+_LEN = struct.Struct(">H")
+_INT_VALUE = struct.Struct(">Hi")
+_BOOL_VALUE = struct.Struct(">H?")
+_INT = struct.Struct(">i")
+_RESP_HDR = struct.Struct(">BBHI")
+
+# Bound pack/unpack methods for the per-attribute hot paths
+_pack_header = _HDR.pack_into
+_pack_attribute_header = _ATTR_HDR.pack_into
+_pack_length = _LEN.pack_into
+_pack_integer = _INT_VALUE.pack_into
+_pack_boolean = _BOOL_VALUE.pack_into
+_unpack_length = _LEN.unpack_from
+_unpack_integer = _INT.unpack_from
+_unpack_response_header = _RESP_HDR.unpack_from
+
+# IPP responses are small binary bodies, don't negotiate compression
+_IPP_HEADERS = {
+    "Content-Type": "application/ipp",
+    "Accept-Encoding": "identity",
+}
+
+# Request IDs only need to be distinct, not unpredictable
+_getrandbits = random.Random().getrandbits
 
 
 class IPPOperationError(Exception):
     """Exception raised for IPP operation errors."""
 
+    def __init__(
+        self, message: str | None = None, status_code: int | None = None
+    ) -> None:
+        """Initialize the error with the IPP status code, if any."""
+        super().__init__(message, status_code)
+        self.status_code = status_code
+
+    def __str__(self) -> str:
+        """Return the message, formatting status code errors on demand."""
+        message, status_code = self.args
+        if message is None and status_code is not None:
+            return f"IPP operation failed with status code 0x{status_code:04x}"
+        return str(message)
+
 
 class IPPOperations:
     """Handle IPP operations for printer and job management."""
@@ -52,144 +116,323 @@ class IPPOperations:
         self.tls = tls
         self._scheme = "https" if tls else "http"
         self._printer_uri = f"ipp{'s' if tls else ''}://{host}:{port}{base_path}"
+        self._job_uri_prefix = self._printer_uri + "/"
+
+        # charset and natural-language (required) never change, nor does the
+        # printer-uri, so encode the leading operation attributes only once
+        prologue: list[tuple[int, bytes, Any]] = [
+            (IPP_TAG_CHARSET, b"attributes-charset", b"utf-8"),
+            (IPP_TAG_LANGUAGE, b"attributes-natural-language", b"en"),
+        ]
+        self._prefix_no_uri = self._encode_attributes(prologue)
+        self._prefix_printer_uri = self._encode_attributes(
+            [*prologue, (IPP_TAG_URI, b"printer-uri", self._printer_uri.encode())]
+        )
 
     def _build_ipp_request(
         self,
         operation_id: int,
         request_id: int,
         attributes: dict[str, Any],
-    ) -> bytes:
+        subscription_attributes: dict[str, Any] | None = None,
+    ) -> bytearray:
         """Build an IPP request packet."""
-        # IPP version (2 bytes)
-        version = IPP_VERSION_2_0
-        request = bytearray()
-        request.extend(version)
-
-        # Operation ID (2 bytes)
-        request.extend(operation_id.to_bytes(2, byteorder="big"))
-
-        # Request ID (4 bytes)
-        request.extend(request_id.to_bytes(4, byteorder="big"))
-
-        # Operation attributes tag
-        request.append(IPP_TAG_OPERATION)
-
-        # charset attribute (required)
-        self._add_attribute(
-            request,
-            IPP_TAG_CHARSET,
-            "attributes-charset",
-            "utf-8",
-        )
-
-        # natural-language attribute (required)
-        self._add_attribute(
-            request,
-            IPP_TAG_LANGUAGE,
-            "attributes-natural-language",
-            "en",
-        )
+        # Collect the encoded (tag, name, value) triples of each group first so
+        # the packet can be written into a single buffer of the exact size
+        operation: list[tuple[int, bytes, Any]] = []
 
         # printer-uri or job-uri attribute (required)
-        if "printer-uri" in attributes:
-            self._add_attribute(
-                request,
-                IPP_TAG_URI,
-                "printer-uri",
-                attributes["printer-uri"],
-            )
+        printer_uri = attributes.get("printer-uri")
+        if printer_uri == self._printer_uri:
+            prefix = self._prefix_printer_uri
+        else:
+            prefix = self._prefix_no_uri
+            if printer_uri is not None:
+                operation.append((IPP_TAG_URI, b"printer-uri", printer_uri.encode()))
 
         if "job-uri" in attributes:
-            self._add_attribute(
-                request,
-                IPP_TAG_URI,
-                "job-uri",
-                attributes["job-uri"],
+            operation.append(
+                (IPP_TAG_URI, b"job-uri", attributes["job-uri"].encode())
             )
 
         # job-id attribute (for job operations)
         if "job-id" in attributes:
-            self._add_integer_attribute(
-                request,
-                "job-id",
-                attributes["job-id"],
-            )
+            operation.append((IPP_TAG_INTEGER, b"job-id", attributes["job-id"]))
 
         # requesting-user-name (optional but recommended)
         if "requesting-user-name" in attributes:
-            self._add_attribute(
-                request,
-                IPP_TAG_NAME,
-                "requesting-user-name",
-                attributes["requesting-user-name"],
+            operation.append(
+                (
+                    IPP_TAG_NAME,
+                    b"requesting-user-name",
+                    attributes["requesting-user-name"].encode(),
+                )
             )
 
-        # End of attributes
-        request.append(IPP_TAG_END)
+        # Get-Jobs filters
+        if "which-jobs" in attributes:
+            operation.append(
+                (IPP_TAG_KEYWORD, b"which-jobs", attributes["which-jobs"].encode())
+            )
 
-        return bytes(request)
+        if "limit" in attributes:
+            operation.append((IPP_TAG_INTEGER, b"limit", attributes["limit"]))
+
+        if "requested-attributes" in attributes:
+            for index, name in enumerate(attributes["requested-attributes"]):
+                # Additional values of a 1setOf attribute have an empty name
+                operation.append(
+                    (
+                        IPP_TAG_KEYWORD,
+                        b"" if index else b"requested-attributes",
+                        name.encode(),
+                    )
+                )
+
+        # notify-* attributes (for subscription operations)
+        for name in (
+            "notify-subscription-id",
+            "notify-subscription-ids",
+            "notify-sequence-numbers",
+        ):
+            if name in attributes:
+                operation.append((IPP_TAG_INTEGER, name.encode(), attributes[name]))
+
+        if "notify-wait" in attributes:
+            operation.append(
+                (IPP_TAG_BOOLEAN, b"notify-wait", attributes["notify-wait"])
+            )
+
+        groups = [(IPP_TAG_OPERATION, prefix, operation)]
+
+        # Subscription template attributes (Create-Printer-Subscriptions)
+        if subscription_attributes:
+            subscription: list[tuple[int, bytes, Any]] = [
+                # Additional values of a 1setOf attribute have an empty name
+                (IPP_TAG_KEYWORD, b"" if index else b"notify-events", event.encode())
+                for index, event in enumerate(subscription_attributes["notify-events"])
+            ]
+            subscription.append(
+                (
+                    IPP_TAG_KEYWORD,
+                    b"notify-pull-method",
+                    subscription_attributes["notify-pull-method"].encode(),
+                )
+            )
+            subscription.append(
+                (
+                    IPP_TAG_INTEGER,
+                    b"notify-lease-duration",
+                    subscription_attributes["notify-lease-duration"],
+                )
+            )
+            groups.append((IPP_TAG_SUBSCRIPTION, b"", subscription))
+
+        # Header, one delimiter per group, the attributes and the end tag
+        size = _HDR.size + len(groups) + 1
+        for _, encoded, group in groups:
+            size += len(encoded) + self._attributes_size(group)
+
+        request = bytearray(size)
+
+        # Version 2.0, operation ID and request ID
+        _pack_header(request, 0, 0x0200, operation_id, request_id)
+        offset = _HDR.size
+
+        for group_tag, encoded, group in groups:
+            request[offset] = group_tag
+            offset += 1
+
+            # Cached, already encoded leading attributes of the group
+            end = offset + len(encoded)
+            request[offset:end] = encoded
+
+            offset = self._write_attributes(request, end, group)
+
+        # End of attributes
+        request[offset] = IPP_TAG_END
+
+        # aiohttp posts a bytearray as is, no need for an immutable copy
+        return request
+
+    def _encode_attributes(self, attributes: list[tuple[int, bytes, Any]]) -> bytes:
+        """Encode a sequence of attributes on their own."""
+        encoded = bytearray(self._attributes_size(attributes))
+        self._write_attributes(encoded, 0, attributes)
+        return bytes(encoded)
+
+    @staticmethod
+    def _attributes_size(attributes: list[tuple[int, bytes, Any]]) -> int:
+        """Return the encoded size of a sequence of attributes."""
+        size = 0
+        for tag, name, value in attributes:
+            size += _ATTR_HDR.size + len(name) + _LEN.size
+            if tag == IPP_TAG_INTEGER:
+                size += 4
+            elif tag == IPP_TAG_BOOLEAN:
+                size += 1
+            else:
+                size += len(value)
+        return size
+
+    def _write_attributes(
+        self,
+        request: bytearray,
+        offset: int,
+        attributes: list[tuple[int, bytes, Any]],
+    ) -> int:
+        """Write a sequence of attributes into the request at offset."""
+        for tag, name, value in attributes:
+            if tag == IPP_TAG_INTEGER:
+                offset = self._add_integer_attribute(request, offset, name, value)
+            elif tag == IPP_TAG_BOOLEAN:
+                offset = self._add_boolean_attribute(request, offset, name, value)
+            else:
+                offset = self._add_attribute(request, offset, tag, name, value)
+        return offset
 
     def _add_attribute(
         self,
         request: bytearray,
+        offset: int,
         tag: int,
-        name: str,
-        value: str,
-    ) -> None:
-        """Add a string attribute to IPP request."""
-        # Value tag
-        request.append(tag)
-
-        # Name length (2 bytes)
-        name_bytes = name.encode("utf-8")
-        request.extend(len(name_bytes).to_bytes(2, byteorder="big"))
+        name: bytes,
+        value: bytes,
+    ) -> int:
+        """Write a string attribute into the request and return the new offset."""
+        # Value tag and name length
+        _pack_attribute_header(request, offset, tag, len(name))
+        offset += _ATTR_HDR.size
 
         # Name
-        request.extend(name_bytes)
+        end = offset + len(name)
+        request[offset:end] = name
+        offset = end
 
-        # Value length (2 bytes)
-        value_bytes = value.encode("utf-8")
-        request.extend(len(value_bytes).to_bytes(2, byteorder="big"))
+        # Value length and value
+        _pack_length(request, offset, len(value))
+        offset += _LEN.size
+        end = offset + len(value)
+        request[offset:end] = value
 
-        # Value
-        request.extend(value_bytes)
+        return end
 
     def _add_integer_attribute(
         self,
         request: bytearray,
-        name: str,
+        offset: int,
+        name: bytes,
         value: int,
-    ) -> None:
-        """Add an integer attribute to IPP request."""
-        # Value tag
-        request.append(IPP_TAG_INTEGER)
+    ) -> int:
+        """Write an integer attribute into the request and return the new offset."""
+        # Value tag and name length
+        _pack_attribute_header(request, offset, IPP_TAG_INTEGER, len(name))
+        offset += _ATTR_HDR.size
 
-        # Name length (2 bytes)
-        name_bytes = name.encode("utf-8")
-        request.extend(len(name_bytes).to_bytes(2, byteorder="big"))
+        # Name
+        end = offset + len(name)
+        request[offset:end] = name
+
+        # Value length (integers are always 4 bytes) and value
+        _pack_integer(request, end, 4, value)
+
+        return end + _INT_VALUE.size
+
+    def _add_boolean_attribute(
+        self,
+        request: bytearray,
+        offset: int,
+        name: bytes,
+        value: bool,
+    ) -> int:
+        """Write a boolean attribute into the request and return the new offset."""
+        # Value tag and name length
+        _pack_attribute_header(request, offset, IPP_TAG_BOOLEAN, len(name))
+        offset += _ATTR_HDR.size
 
         # Name
-        request.extend(name_bytes)
+        end = offset + len(name)
+        request[offset:end] = name
 
-        # Value length (2 bytes) - integers are always 4 bytes
-        request.extend((4).to_bytes(2, byteorder="big"))
+        # Value length (booleans are always 1 byte) and value
+        _pack_boolean(request, end, 1, value)
 
-        # Value (4 bytes)
-        request.extend(value.to_bytes(4, byteorder="big", signed=True))
+        return end + _BOOL_VALUE.size
+
+    def _parse_attribute_groups(
+        self,
+        response_data: bytes,
+        offset: int,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Parse the attribute groups of an IPP response.
+
+        Returns a list of (group tag, attributes) tuples. Multi-valued
+        attributes are returned as lists.
+        """
+        groups: list[tuple[int, dict[str, Any]]] = []
+        current: dict[str, Any] | None = None
+        last_name = ""
+
+        while offset < len(response_data):
+            tag = response_data[offset]
+            offset += 1
+
+            if tag == IPP_TAG_END:
+                break
+
+            if tag <= IPP_TAG_MAX_DELIMITER:
+                current = {}
+                groups.append((tag, current))
+                continue
+
+            try:
+                (name_length,) = _unpack_length(response_data, offset)
+                offset += 2
+                name = response_data[offset : offset + name_length].decode("utf-8")
+                offset += name_length
+
+                (value_length,) = _unpack_length(response_data, offset)
+            except struct.error as err:
+                raise IPPOperationError("Truncated response") from err
+            offset += 2
+            raw_value = response_data[offset : offset + value_length]
+            offset += value_length
+
+            if tag in (IPP_TAG_INTEGER, IPP_TAG_ENUM) and len(raw_value) == 4:
+                value: Any = _unpack_integer(raw_value)[0]
+            elif tag == IPP_TAG_BOOLEAN:
+                value = raw_value != b"\x00"
+            elif tag in IPP_STRING_TAGS:
+                value = raw_value.decode("utf-8", errors="replace")
+            else:
+                value = bytes(raw_value)
+
+            if current is None:
+                raise IPPOperationError("Attribute outside of a group")
+
+            if name:
+                last_name = name
+                current[name] = value
+            elif last_name in current:
+                # Additional value of the previous attribute
+                previous = current[last_name]
+                if isinstance(previous, list):
+                    previous.append(value)
+                else:
+                    current[last_name] = [previous, value]
+
+        return groups
 
     def _parse_ipp_response(self, response_data: bytes) -> dict[str, Any]:
         """Parse an IPP response packet."""
         if len(response_data) < 8:
             raise IPPOperationError("Response too short")
 
-        # Parse version (2 bytes)
-        version = (response_data[0], response_data[1])
-
-        # Parse status code (2 bytes)
-        status_code = int.from_bytes(response_data[2:4], byteorder="big")
-
-        # Parse request ID (4 bytes)
-        request_id = int.from_bytes(response_data[4:8], byteorder="big")
+        # Version (2 bytes), status code (2 bytes) and request ID (4 bytes)
+        major, minor, status_code, request_id = _unpack_response_header(
+            response_data
+        )
+        version = (major, minor)
 
         _LOGGER.debug(
             "IPP response: version=%s, status=0x%04x, request_id=%d",
@@ -203,28 +446,28 @@ class IPPOperations:
         # 0x0001 = successful-ok-ignored-or-substituted-attributes
         # 0x0002 = successful-ok-conflicting-attributes
         if status_code > 0x00FF:
-            raise IPPOperationError(
-                f"IPP operation failed with status code 0x{status_code:04x}"
-            )
+            raise IPPOperationError(status_code=status_code)
 
         return {
             "version": version,
             "status_code": status_code,
             "request_id": request_id,
+            "groups": self._parse_attribute_groups(response_data, 8),
         }
 
     async def _send_ipp_request(
         self,
         operation_id: int,
         attributes: dict[str, Any],
+        subscription_attributes: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Send an IPP request and parse the response."""
-        import random
-
-        request_id = random.randint(1, 2147483647)
+        request_id = _getrandbits(31) or 1
 
         # Build request
-        request_data = self._build_ipp_request(operation_id, request_id, attributes)
+        request_data = self._build_ipp_request(
+            operation_id, request_id, attributes, subscription_attributes
+        )
 
         # Send request
         url = f"{self._scheme}://{self.host}:{self.port}{self.base_path}"
@@ -235,9 +478,7 @@ class IPPOperations:
             async with self.session.post(
                 url,
                 data=request_data,
-                headers={
-                    "Content-Type": "application/ipp",
-                },
+                headers=_IPP_HEADERS,
             ) as response:
                 response.raise_for_status()
                 response_data = await response.read()
@@ -249,9 +490,33 @@ class IPPOperations:
 
                 return result
 
+        # Callers decide how loudly to report a failure, the event listener
+        # retries these every UPDATE_INTERVAL
         except aiohttp.ClientError as err:
-            _LOGGER.error("HTTP error during IPP operation: %s", err)
+            _LOGGER.debug("HTTP error during IPP operation: %s", err)
             raise IPPOperationError(f"HTTP error: {err}") from err
+        except asyncio.TimeoutError as err:
+            _LOGGER.debug("Timeout during IPP operation 0x%04x", operation_id)
+            raise IPPOperationError("Timeout") from err
+
+    async def _run(
+        self,
+        operation_id: int,
+        attributes: dict[str, Any],
+        action: str,
+    ) -> bool:
+        """Send a printer or job operation and report whether it succeeded."""
+        try:
+            await self._send_ipp_request(operation_id, attributes)
+            return True
+        except IPPOperationError as err:
+            if "job-id" in attributes:
+                _LOGGER.error(
+                    "Failed to %s %d: %s", action, attributes["job-id"], err
+                )
+            else:
+                _LOGGER.error("Failed to %s: %s", action, err)
+            return False
 
     async def pause_printer(self, requesting_user: str = "home-assistant") -> bool:
         """Pause the printer."""
@@ -260,12 +525,7 @@ class IPPOperations:
             "requesting-user-name": requesting_user,
         }
 
-        try:
-            await self._send_ipp_request(IPP_OP_PAUSE_PRINTER, attributes)
-            return True
-        except IPPOperationError as err:
-            _LOGGER.error("Failed to pause printer: %s", err)
-            return False
+        return await self._run(IPP_OP_PAUSE_PRINTER, attributes, "pause printer")
 
     async def resume_printer(self, requesting_user: str = "home-assistant") -> bool:
         """Resume the printer."""
@@ -274,12 +534,7 @@ class IPPOperations:
             "requesting-user-name": requesting_user,
         }
 
-        try:
-            await self._send_ipp_request(IPP_OP_RESUME_PRINTER, attributes)
-            return True
-        except IPPOperationError as err:
-            _LOGGER.error("Failed to resume printer: %s", err)
-            return False
+        return await self._run(IPP_OP_RESUME_PRINTER, attributes, "resume printer")
 
     async def purge_jobs(self, requesting_user: str = "home-assistant") -> bool:
         """Cancel all jobs on the printer."""
@@ -288,12 +543,7 @@ class IPPOperations:
             "requesting-user-name": requesting_user,
         }
 
-        try:
-            await self._send_ipp_request(IPP_OP_PURGE_JOBS, attributes)
-            return True
-        except IPPOperationError as err:
-            _LOGGER.error("Failed to purge jobs: %s", err)
-            return False
+        return await self._run(IPP_OP_PURGE_JOBS, attributes, "purge jobs")
 
     async def hold_job(
         self,
@@ -301,19 +551,14 @@ class IPPOperations:
         requesting_user: str = "home-assistant",
     ) -> bool:
         """Pause a specific job."""
-        job_uri = f"{self._printer_uri}/{job_id}"
+        job_uri = self._job_uri_prefix + str(job_id)
         attributes = {
             "job-uri": job_uri,
             "job-id": job_id,
             "requesting-user-name": requesting_user,
         }
 
-        try:
-            await self._send_ipp_request(IPP_OP_HOLD_JOB, attributes)
-            return True
-        except IPPOperationError as err:
-            _LOGGER.error("Failed to hold job %d: %s", job_id, err)
-            return False
+        return await self._run(IPP_OP_HOLD_JOB, attributes, "hold job")
 
     async def release_job(
         self,
@@ -321,19 +566,14 @@ class IPPOperations:
         requesting_user: str = "home-assistant",
     ) -> bool:
         """Resume a paused job."""
-        job_uri = f"{self._printer_uri}/{job_id}"
+        job_uri = self._job_uri_prefix + str(job_id)
         attributes = {
             "job-uri": job_uri,
             "job-id": job_id,
             "requesting-user-name": requesting_user,
         }
 
-        try:
-            await self._send_ipp_request(IPP_OP_RELEASE_JOB, attributes)
-            return True
-        except IPPOperationError as err:
-            _LOGGER.error("Failed to release job %d: %s", job_id, err)
-            return False
+        return await self._run(IPP_OP_RELEASE_JOB, attributes, "release job")
 
     async def cancel_job(
         self,
@@ -341,16 +581,118 @@ class IPPOperations:
         requesting_user: str = "home-assistant",
     ) -> bool:
         """Cancel a specific job."""
-        job_uri = f"{self._printer_uri}/{job_id}"
+        job_uri = self._job_uri_prefix + str(job_id)
         attributes = {
             "job-uri": job_uri,
             "job-id": job_id,
             "requesting-user-name": requesting_user,
         }
 
+        return await self._run(IPP_OP_CANCEL_JOB, attributes, "cancel job")
+
+    async def get_active_job_count(
+        self,
+        limit: int,
+        requesting_user: str = "home-assistant",
+    ) -> int | None:
+        """Return the number of pending jobs, counting at most limit jobs."""
+        # Only ask for unfinished jobs and their IDs, bounded by limit, so the
+        # server never walks the completed job history
+        attributes = {
+            "printer-uri": self._printer_uri,
+            "requesting-user-name": requesting_user,
+            "which-jobs": "not-completed",
+            "limit": limit,
+            "requested-attributes": ["job-id"],
+        }
+
+        try:
+            result = await self._send_ipp_request(IPP_OP_GET_JOBS, attributes)
+        except IPPOperationError as err:
+            _LOGGER.debug("Failed to get jobs: %s", err)
+            return None
+
+        return sum(1 for tag, _ in result["groups"] if tag == IPP_TAG_JOB)
+
+    async def create_printer_subscription(
+        self,
+        events: list[str],
+        lease_duration: int,
+        requesting_user: str = "home-assistant",
+    ) -> int:
+        """Create an ippget pull subscription and return its ID."""
+        attributes = {
+            "printer-uri": self._printer_uri,
+            "requesting-user-name": requesting_user,
+        }
+        subscription_attributes = {
+            "notify-events": events,
+            "notify-pull-method": "ippget",
+            "notify-lease-duration": lease_duration,
+        }
+
+        result = await self._send_ipp_request(
+            IPP_OP_CREATE_PRINTER_SUBSCRIPTIONS,
+            attributes,
+            subscription_attributes,
+        )
+
+        for tag, group in result["groups"]:
+            if tag == IPP_TAG_SUBSCRIPTION and "notify-subscription-id" in group:
+                return group["notify-subscription-id"]
+
+        # The server answered, asking again won't produce an ID
+        raise IPPOperationError(
+            "No subscription ID in response", status_code=result["status_code"]
+        )
+
+    async def get_notifications(
+        self,
+        subscription_id: int,
+        sequence_number: int,
+        wait: bool = True,
+        requesting_user: str = "home-assistant",
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Fetch pending events of a subscription.
+
+        Returns the events and the notify-get-interval suggested by the
+        server before the next poll, if any.
+        """
+        attributes = {
+            "printer-uri": self._printer_uri,
+            "requesting-user-name": requesting_user,
+            "notify-subscription-ids": subscription_id,
+            "notify-sequence-numbers": sequence_number,
+            "notify-wait": wait,
+        }
+
+        result = await self._send_ipp_request(IPP_OP_GET_NOTIFICATIONS, attributes)
+
+        events = []
+        interval = None
+        for tag, group in result["groups"]:
+            if tag == IPP_TAG_EVENT_NOTIFICATION:
+                events.append(group)
+            elif tag == IPP_TAG_OPERATION and "notify-get-interval" in group:
+                interval = group["notify-get-interval"]
+
+        return events, interval
+
+    async def cancel_subscription(
+        self,
+        subscription_id: int,
+        requesting_user: str = "home-assistant",
+    ) -> bool:
+        """Cancel a subscription."""
+        attributes = {
+            "printer-uri": self._printer_uri,
+            "requesting-user-name": requesting_user,
+            "notify-subscription-id": subscription_id,
+        }
+
         try:
-            await self._send_ipp_request(IPP_OP_CANCEL_JOB, attributes)
+            await self._send_ipp_request(IPP_OP_CANCEL_SUBSCRIPTION, attributes)
             return True
         except IPPOperationError as err:
-            _LOGGER.error("Failed to cancel job %d: %s", job_id, err)
+            _LOGGER.debug("Failed to cancel subscription %d: %s", subscription_id, err)
             return False
@@ -36,6 +36,20 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Printer state labels
+STATE_LABELS = {
+    PRINTER_STATE_IDLE: "idle",
+    PRINTER_STATE_PROCESSING: "printing",
+    PRINTER_STATE_STOPPED: "stopped",
+}
+
+# Marker icons by type keyword, checked in order ("waste-toner" is a toner)
+MARKER_ICONS = {
+    "toner": "mdi:printer-3d-nozzle",
+    "ink": "mdi:water",
+    "waste": "mdi:delete",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -75,18 +89,7 @@ class CUPSSensorBase(CoordinatorEntity, SensorEntity):
     @property
     def device_info(self):
         """Return device information."""
-        printer = self.coordinator.data.get("printer")
-        if not printer:
-            return None
-
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": printer.info.name or self._entry.title,
-            "manufacturer": printer.info.make_and_model.split()[0] if printer.info.make_and_model else "Unknown",
-            "model": printer.info.make_and_model or "Unknown",
-            "sw_version": printer.info.printer_firmware_string_version,
-            "configuration_url": printer.info.printer_uri_supported[0] if printer.info.printer_uri_supported else None,
-        }
+        return self.coordinator.device_info_cache
 
 
 class CUPSPrinterStateSensor(CUPSSensorBase):
@@ -107,15 +110,7 @@ class CUPSPrinterStateSensor(CUPSSensorBase):
         if not printer:
             return None
 
-        state = printer.state.printer_state
-        if state == PRINTER_STATE_IDLE:
-            return "idle"
-        elif state == PRINTER_STATE_PROCESSING:
-            return "printing"
-        elif state == PRINTER_STATE_STOPPED:
-            return "stopped"
-        else:
-            return "unknown"
+        return STATE_LABELS.get(printer.state.printer_state, "unknown")
 
     @property
     def extra_state_attributes(self):
@@ -159,8 +154,15 @@ class CUPSMarkerLevelSensor(CUPSSensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._marker_index = marker_index
+        # Name and icon are fixed once the marker has been discovered
         self._update_attributes()
 
+    async def async_added_to_hass(self) -> None:
+        """Register the marker sensor with the coordinator."""
+        await super().async_added_to_hass()
+        self.coordinator.async_add_marker_listener()
+        self.async_on_remove(self.coordinator.async_remove_marker_listener)
+
     def _update_attributes(self):
         """Update sensor attributes based on marker."""
         marker = self._get_marker()
@@ -177,14 +179,11 @@ class CUPSMarkerLevelSensor(CUPSSensorBase):
             self._attr_unique_id = f"{self._entry.entry_id}_marker_{self._marker_index}"
 
             # Set icon based on marker type
-            if "toner" in marker.marker_type.lower():
-                self._attr_icon = "mdi:printer-3d-nozzle"
-            elif "ink" in marker.marker_type.lower():
-                self._attr_icon = "mdi:water"
-            elif "waste" in marker.marker_type.lower():
-                self._attr_icon = "mdi:delete"
-            else:
-                self._attr_icon = "mdi:square"
+            marker_type = marker.marker_type.lower()
+            self._attr_icon = next(
+                (icon for key, icon in MARKER_ICONS.items() if key in marker_type),
+                "mdi:square",
+            )
 
     def _get_marker(self):
         """Get the marker for this sensor."""
@@ -220,11 +219,6 @@ class CUPSMarkerLevelSensor(CUPSSensorBase):
             ATTR_MARKER_LEVEL: marker.level,
         }
 
-    async def async_update(self):
-        """Update the entity."""
-        await super().async_update()
-        self._update_attributes()
-
 
 class CUPSQueueLengthSensor(CUPSSensorBase):
     """Representation of a CUPS print queue length sensor."""
@@ -241,6 +235,5 @@ class CUPSQueueLengthSensor(CUPSSensorBase):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        # Note: This would require fetching job list, which is not in current pyipp Printer object
-        # For now, return 0. Can be enhanced later with job management
-        return 0
+        # Number of pending jobs, capped at JOB_COUNT_LIMIT
+        return self.coordinator.data.get("active_jobs")
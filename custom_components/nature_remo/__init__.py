@@ -1,15 +1,28 @@
 """The Nature Remo integration."""
+import asyncio
 import logging
+import sys
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ACCESS_TOKEN, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import NatureRemoAPI
-from .const import DOMAIN, UPDATE_INTERVAL
+from .const import (
+    APPLIANCE_TYPE_AC,
+    APPLIANCE_TYPE_IR,
+    APPLIANCE_TYPE_LIGHT,
+    APPLIANCES_UPDATE_INTERVAL,
+    DEVICES_UPDATE_INTERVAL,
+    DOMAIN,
+    POWER_SIGNAL_KEYWORDS,
+    REQUEST_REFRESH_COOLDOWN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,13 +41,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     session = async_get_clientsession(hass)
     api = NatureRemoAPI(access_token, session)
 
-    coordinator = NatureRemoDataUpdateCoordinator(hass, api)
-    await coordinator.async_config_entry_first_refresh()
+    # Sensor readings change often, appliance settings only on user action,
+    # so the two endpoints are polled by separate coordinators
+    devices_coordinator = NatureRemoDevicesCoordinator(hass, api)
+    appliances_coordinator = NatureRemoAppliancesCoordinator(hass, api)
+    await asyncio.gather(
+        devices_coordinator.async_config_entry_first_refresh(),
+        appliances_coordinator.async_config_entry_first_refresh(),
+    )
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
-        "coordinator": coordinator,
+        "devices_coordinator": devices_coordinator,
+        "appliances_coordinator": appliances_coordinator,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -52,29 +72,116 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
-class NatureRemoDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Nature Remo data."""
+# device_info dicts by (device id, name), shared by all entities of a device
+_DEVICE_INFO_CACHE: dict[tuple[str | None, str], dict[str, Any]] = {}
+
+
+def get_device_info(device_id: str | None, device_name: str) -> dict[str, Any]:
+    """Return the device info of a Nature Remo device."""
+    key = (device_id, device_name)
+    info = _DEVICE_INFO_CACHE.get(key)
+    if info is None:
+        info = _DEVICE_INFO_CACHE[key] = {
+            "identifiers": {(DOMAIN, device_id)},
+            "name": device_name,
+            "manufacturer": "Nature",
+            "model": "Nature Remo",
+        }
+    return info
+
+
+def _temp_bounds_by_mode(appliance: dict[str, Any]) -> dict[str, tuple[float, float]]:
+    """Return the target temperature range of each mode of an AC."""
+    modes = appliance.get("aircon", {}).get("range", {}).get("modes")
+    if not isinstance(modes, dict):
+        return {}
+
+    # modes is a dict like {"cool": {"temp": [...], "vol": [...]}}
+    bounds = {}
+    for mode, mode_settings in modes.items():
+        try:
+            temps = [float(t) for t in mode_settings.get("temp", []) if t]
+        except (ValueError, TypeError):
+            continue
+        if temps:
+            bounds[mode] = (min(temps), max(temps))
+    return bounds
+
+
+def _power_signals(appliance: dict[str, Any]) -> dict[str, str]:
+    """Return the IDs of the on and off signals of an IR appliance."""
+    power_signals = {}
+    for signal in appliance.get("signals", []):
+        name = signal["name"].lower()
+        for key, keywords in POWER_SIGNAL_KEYWORDS.items():
+            if key not in power_signals and any(k in name for k in keywords):
+                power_signals[key] = signal["id"]
+        if len(power_signals) == len(POWER_SIGNAL_KEYWORDS):
+            break
+    return power_signals
+
+
+class NatureRemoDevicesCoordinator(DataUpdateCoordinator):
+    """Class to manage fetching Nature Remo devices and their sensor readings."""
 
     def __init__(self, hass: HomeAssistant, api: NatureRemoAPI) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            name=f"{DOMAIN}_devices",
+            update_interval=timedelta(seconds=DEVICES_UPDATE_INTERVAL),
+            # Only notify entities when the fetched data actually changed
+            always_update=False,
         )
         self.api = api
 
     async def _async_update_data(self):
-        """Fetch data from API."""
+        """Fetch devices from API."""
         try:
             devices = await self.api.get_devices()
+        except Exception as err:
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+        _LOGGER.debug("Fetched %d devices from Nature Remo API", len(devices))
+
+        return {
+            "devices": devices,
+            # Index devices once per refresh so entities don't rescan the list
+            "devices_by_id": {device["id"]: device for device in devices},
+        }
+
+
+class NatureRemoAppliancesCoordinator(DataUpdateCoordinator):
+    """Class to manage fetching Nature Remo appliances."""
+
+    def __init__(self, hass: HomeAssistant, api: NatureRemoAPI) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_appliances",
+            update_interval=timedelta(seconds=APPLIANCES_UPDATE_INTERVAL),
+            # Only notify entities when the fetched data actually changed
+            always_update=False,
+            # Coalesce the refreshes requested by back-to-back service calls
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
+        )
+        self.api = api
+
+    async def _async_update_data(self):
+        """Fetch appliances from API."""
+        try:
             appliances = await self.api.get_appliances()
+        except Exception as err:
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-            _LOGGER.debug("Fetched %d devices from Nature Remo API", len(devices))
-            _LOGGER.debug("Fetched %d appliances from Nature Remo API", len(appliances))
+        _LOGGER.debug("Fetched %d appliances from Nature Remo API", len(appliances))
 
-            # Log appliance types for debugging
+        # Log appliance types for debugging, skipping the loop otherwise
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             for appliance in appliances:
                 _LOGGER.debug(
                     "Appliance: %s (type: %s, id: %s)",
@@ -83,9 +190,66 @@ class NatureRemoDataUpdateCoordinator(DataUpdateCoordinator):
                     appliance.get("id"),
                 )
 
-            return {
-                "devices": devices,
-                "appliances": appliances,
+        # Entities keep these ids, share one string per id across refreshes
+        for appliance in appliances:
+            appliance["id"] = sys.intern(appliance["id"])
+
+        # Index appliances once per refresh so entities don't rescan the list
+        appliances_by_id = {appliance["id"]: appliance for appliance in appliances}
+        # Signal IDs by name per appliance, the first signal wins on
+        # duplicate names
+        signals_by_name = {
+            appliance["id"]: {
+                signal["name"]: signal["id"]
+                for signal in reversed(appliance.get("signals", []))
             }
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+            for appliance in appliances
+        }
+        smart_meters = [
+            appliance
+            for appliance in appliances
+            if appliance.get("type") == "EL_SMART_METER"
+        ]
+        # ECHONET Lite properties by EPC per smart meter
+        smart_meter_props = {
+            appliance["id"]: {
+                prop["epc"]: prop
+                for prop in appliance.get("smart_meter", {}).get(
+                    "echonetlite_properties", []
+                )
+            }
+            for appliance in smart_meters
+        }
+
+        # Target temperature (min, max) per AC operation mode
+        temp_bounds = {
+            appliance["id"]: _temp_bounds_by_mode(appliance)
+            for appliance in appliances
+            if appliance.get("type") == APPLIANCE_TYPE_AC
+        }
+        # First on and off signal per IR appliance, for the switches
+        power_signals = {
+            appliance["id"]: _power_signals(appliance)
+            for appliance in appliances
+            if appliance.get("type") == APPLIANCE_TYPE_IR
+        }
+        # Button names per light, for its state attributes
+        light_buttons = {
+            appliance["id"]: tuple(
+                button["name"]
+                for button in appliance.get("light", {}).get("buttons", [])
+            )
+            for appliance in appliances
+            if appliance.get("type") == APPLIANCE_TYPE_LIGHT
+        }
+
+        return {
+            "appliances": appliances,
+            "appliances_by_id": appliances_by_id,
+            "signals_by_name": signals_by_name,
+            "smart_meters": smart_meters,
+            "smart_meter_props": smart_meter_props,
+            "temp_bounds": temp_bounds,
+            "power_signals": power_signals,
+            "light_buttons": light_buttons,
+        }
@@ -8,6 +8,8 @@ from .const import API_BASE_URL, API_VERSION
 
 _LOGGER = logging.getLogger(__name__)
 
+_API_ROOT = f"{API_BASE_URL}/{API_VERSION}/"
+
 
 class NatureRemoAPI:
     """Nature Remo API client."""
@@ -16,15 +18,20 @@ class NatureRemoAPI:
         """Initialize the API client."""
         self._access_token = access_token
         self._session = session
-        self._base_url = f"{API_BASE_URL}/{API_VERSION}"
+        # Nature Remo API uses form-urlencoded for POST requests with a body
+        self._headers_json = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        }
+        self._headers_form = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
 
     @property
     def headers(self) -> dict[str, str]:
         """Return the headers for API requests."""
-        return {
-            "Authorization": f"Bearer {self._access_token}",
-            "Content-Type": "application/json",
-        }
+        return self._headers_json
 
     async def _request(
         self,
@@ -33,31 +40,25 @@ class NatureRemoAPI:
         data: dict[str, Any] | None = None,
     ) -> dict[str, Any] | list[dict[str, Any]]:
         """Make a request to the Nature Remo API."""
-        url = f"{self._base_url}/{endpoint}"
+        url = _API_ROOT + endpoint
         _LOGGER.debug("Making %s request to %s", method, url)
 
+        if method == "POST" and data:
+            headers = self._headers_form
+        else:
+            headers = self._headers_json
+            data = None
+
         try:
-            # Nature Remo API uses form-urlencoded for POST requests
-            if method == "POST" and data:
-                async with self._session.request(
-                    method,
-                    url,
-                    headers={
-                        "Authorization": f"Bearer {self._access_token}",
-                        "Content-Type": "application/x-www-form-urlencoded",
-                    },
-                    data=data,
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
-            else:
-                async with self._session.request(
-                    method,
-                    url,
-                    headers=self.headers,
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            async with self._session.request(
+                method,
+                url,
+                headers=headers,
+                data=data,
+            ) as response:
+                response.raise_for_status()
+                # Skip the Content-Type check, the API always returns JSON
+                return await response.json(content_type=None)
         except aiohttp.ClientError as err:
             _LOGGER.error("Error making request to %s: %s", url, err)
             raise
@@ -108,17 +109,21 @@ class NatureRemoAPI:
         button: str | None = None,
     ) -> dict[str, Any]:
         """Update air conditioner settings."""
-        data = {}
-        if temperature is not None:
-            data["temperature"] = temperature
-        if operation_mode is not None:
-            data["operation_mode"] = operation_mode
-        if air_volume is not None:
-            data["air_volume"] = air_volume
-        if air_direction is not None:
-            data["air_direction"] = air_direction
-        if button is not None:
-            data["button"] = button
+        data = {
+            key: value
+            for key, value in (
+                ("temperature", temperature),
+                ("operation_mode", operation_mode),
+                ("air_volume", air_volume),
+                ("air_direction", air_direction),
+                ("button", button),
+            )
+            if value is not None
+        }
+
+        # Nothing to change, skip the request
+        if not data:
+            return {}
 
         return await self._request(
             "POST",
@@ -175,16 +180,24 @@ class NatureRemoAPI:
         image: str | None = None,
     ) -> dict[str, Any]:
         """Update an appliance."""
-        data = {}
-        if nickname:
-            data["nickname"] = nickname
-        if image:
-            data["image"] = image
+        data = {
+            key: value
+            for key, value in (("nickname", nickname), ("image", image))
+            if value
+        }
+
+        # Nothing to change, skip the request
+        if not data:
+            return {}
 
         return await self._request("POST", f"appliances/{appliance_id}", data)
 
     async def get_appliance_signals(self, appliance_id: str) -> list[dict[str, Any]]:
-        """Get all signals for an appliance."""
+        """Get all signals for an appliance.
+
+        Fetches every appliance; entities should read the signals from the
+        appliances coordinator's last refresh instead.
+        """
         appliances = await self.get_appliances()
         for appliance in appliances:
             if appliance["id"] == appliance_id:
@@ -220,21 +233,22 @@ class NatureRemoAPI:
         image: str | None = None,
     ) -> dict[str, Any]:
         """Update a signal."""
-        data = {}
-        if name:
-            data["name"] = name
-        if image:
-            data["image"] = image
+        data = {
+            key: value
+            for key, value in (("name", name), ("image", image))
+            if value
+        }
+
+        # Nothing to change, skip the request
+        if not data:
+            return {}
 
         return await self._request("POST", f"signals/{signal_id}", data)
 
     async def get_smart_meter_data(self) -> list[dict[str, Any]]:
         """Get smart meter data from appliances."""
-        appliances = await self.get_appliances()
-        smart_meter_data = []
-
-        for appliance in appliances:
-            if appliance.get("type") == "EL_SMART_METER":
-                smart_meter_data.append(appliance)
-
-        return smart_meter_data
+        return [
+            appliance
+            for appliance in await self.get_appliances()
+            if appliance.get("type") == "EL_SMART_METER"
+        ]
@@ -1,5 +1,6 @@
 """Support for Nature Remo climate devices."""
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -9,10 +10,11 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import get_device_info
 from .const import (
     AC_FAN_AUTO,
     AC_MODE_AUTO,
@@ -28,15 +30,17 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 # Mapping Nature Remo modes to Home Assistant HVAC modes
-NATURE_TO_HA_MODE = {
-    AC_MODE_COOL: HVACMode.COOL,
-    AC_MODE_WARM: HVACMode.HEAT,
-    AC_MODE_DRY: HVACMode.DRY,
-    AC_MODE_BLOW: HVACMode.FAN_ONLY,
-    AC_MODE_AUTO: HVACMode.AUTO,
-}
+NATURE_TO_HA_MODE = MappingProxyType(
+    {
+        AC_MODE_COOL: HVACMode.COOL,
+        AC_MODE_WARM: HVACMode.HEAT,
+        AC_MODE_DRY: HVACMode.DRY,
+        AC_MODE_BLOW: HVACMode.FAN_ONLY,
+        AC_MODE_AUTO: HVACMode.AUTO,
+    }
+)
 
-HA_TO_NATURE_MODE = {v: k for k, v in NATURE_TO_HA_MODE.items()}
+HA_TO_NATURE_MODE = MappingProxyType({v: k for k, v in NATURE_TO_HA_MODE.items()})
 
 
 async def async_setup_entry(
@@ -45,26 +49,22 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Nature Remo climate from a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator = hass.data[DOMAIN][entry.entry_id]["appliances_coordinator"]
+    devices_coordinator = hass.data[DOMAIN][entry.entry_id]["devices_coordinator"]
     api = hass.data[DOMAIN][entry.entry_id]["api"]
 
-    climate_devices = []
-
-    _LOGGER.debug("Setting up climate entities, found %d appliances", len(coordinator.data.get("appliances", [])))
-
-    for appliance in coordinator.data.get("appliances", []):
-        appliance_type = appliance.get("type")
-        _LOGGER.debug("Checking appliance %s with type %s", appliance.get("nickname"), appliance_type)
+    climate_devices = [
+        NatureRemoClimate(coordinator, devices_coordinator, api, appliance["id"])
+        for appliance in coordinator.data.get("appliances", [])
+        if appliance.get("type") == APPLIANCE_TYPE_AC
+    ]
 
-        if appliance_type == APPLIANCE_TYPE_AC:
-            _LOGGER.info("Adding climate entity for %s (id: %s)", appliance.get("nickname"), appliance.get("id"))
-            climate_devices.append(
-                NatureRemoClimate(coordinator, api, appliance["id"])
-            )
-        else:
-            _LOGGER.debug("Skipping non-AC appliance: %s (type: %s)", appliance.get("nickname"), appliance_type)
+    _LOGGER.debug(
+        "Found %d air conditioners among %d appliances",
+        len(climate_devices),
+        len(coordinator.data.get("appliances", [])),
+    )
 
-    _LOGGER.info("Added %d climate entities", len(climate_devices))
     async_add_entities(climate_devices)
 
 
@@ -80,41 +80,88 @@ class NatureRemoClimate(CoordinatorEntity, ClimateEntity):
         | ClimateEntityFeature.TURN_OFF
     )
 
-    def __init__(self, coordinator, api, appliance_id):
+    def __init__(self, coordinator, devices_coordinator, api, appliance_id):
         """Initialize the climate device."""
         super().__init__(coordinator)
+        self._devices_coordinator = devices_coordinator
         self._api = api
         self._appliance_id = appliance_id
         self._attr_unique_id = appliance_id
+        self._last_snapshot: tuple | None = None
+        self._update_appliance()
 
-    @property
-    def _appliance(self):
-        """Return the appliance data."""
-        for appliance in self.coordinator.data.get("appliances", []):
-            if appliance["id"] == self._appliance_id:
-                return appliance
-        return None
+    def _update_appliance(self) -> None:
+        """Resolve the appliance data and derived values shared by properties."""
+        self._appliance = self.coordinator.data["appliances_by_id"].get(
+            self._appliance_id
+        )
 
-    @property
-    def name(self):
-        """Return the name of the climate device."""
         if self._appliance:
-            return self._appliance.get("nickname", "Air Conditioner")
-        return "Air Conditioner"
+            device = self._appliance.get("device", {})
+            self._attr_name = self._appliance.get("nickname", "Air Conditioner")
+            self._attr_device_info = get_device_info(
+                device.get("id"), device.get("name", "Unknown")
+            )
+        else:
+            self._attr_name = "Air Conditioner"
+            self._attr_device_info = None
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        if self._appliance:
-            device_id = self._appliance.get("device", {}).get("id")
-            device_name = self._appliance.get("device", {}).get("name", "Unknown")
-            return {
-                "identifiers": {(DOMAIN, device_id)},
-                "name": device_name,
-                "manufacturer": "Nature",
-                "model": "Nature Remo",
-            }
-        return None
+        self._update_mode_ranges()
+
+    def _update_mode_ranges(self) -> None:
+        """Derive the available modes and temperature range from the appliance."""
+        if not self._appliance:
+            self._temp_bounds: tuple[float, float] = (16, 30)
+            self._hvac_modes: list[HVACMode] = []
+            self._fan_modes: list[str] = []
+            self._swing_modes: list[str] = []
+            return
+
+        aircon = self._appliance.get("aircon", {})
+        range_data = aircon.get("range", {})
+        settings = self._appliance.get("settings") or {}
+        current_mode = settings.get("mode", AC_MODE_AUTO)
+
+        self._temp_bounds = (
+            self.coordinator.data["temp_bounds"]
+            .get(self._appliance_id, {})
+            .get(current_mode, (16, 30))
+        )
+
+        self._hvac_modes = [HVACMode.OFF]
+        self._fan_modes = [AC_FAN_AUTO]
+        self._swing_modes = [AC_SWING_AUTO]
+
+        # modes is a dict like {"cool": {"temp": [...], "vol": [...], "dir": [...]}}
+        if "modes" in range_data and isinstance(range_data["modes"], dict):
+            self._hvac_modes.extend(
+                filter(None, map(NATURE_TO_HA_MODE.get, range_data["modes"]))
+            )
+
+            mode_settings = range_data["modes"].get(current_mode, {})
+            self._fan_modes = mode_settings.get("vol", [AC_FAN_AUTO])
+            self._swing_modes = mode_settings.get("dir", [AC_SWING_AUTO])
+
+    async def async_added_to_hass(self) -> None:
+        """Also follow the faster polled room temperature."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._devices_coordinator.async_add_listener(
+                self._handle_coordinator_update
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached appliance data and write the state if it changed."""
+        self._update_appliance()
+
+        # Either coordinator refreshing doesn't mean this AC changed
+        snapshot = (self.available, self._appliance, self.current_temperature)
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+        super()._handle_coordinator_update()
 
     @property
     def hvac_mode(self):
@@ -126,8 +173,8 @@ class NatureRemoClimate(CoordinatorEntity, ClimateEntity):
         if not settings:
             return HVACMode.OFF
 
-        button = settings.get("button")
-        if button == "power-off" or button == "":
+        # An empty button means the last command powered the AC on
+        if settings.get("button") == "power-off":
             return HVACMode.OFF
 
         mode = settings.get("mode")
@@ -136,20 +183,7 @@ class NatureRemoClimate(CoordinatorEntity, ClimateEntity):
     @property
     def hvac_modes(self):
         """Return the list of available HVAC modes."""
-        if not self._appliance:
-            return []
-
-        modes = [HVACMode.OFF]
-        aircon = self._appliance.get("aircon", {})
-        range_data = aircon.get("range", {})
-
-        # modes is a dict like {"cool": {...}, "warm": {...}}
-        if "modes" in range_data and isinstance(range_data["modes"], dict):
-            for mode_name in range_data["modes"].keys():
-                if mode_name in NATURE_TO_HA_MODE:
-                    modes.append(NATURE_TO_HA_MODE[mode_name])
-
-        return modes
+        return self._hvac_modes
 
     @property
     def current_temperature(self):
@@ -157,7 +191,13 @@ class NatureRemoClimate(CoordinatorEntity, ClimateEntity):
         if not self._appliance:
             return None
 
+        # Prefer the device reading, polled more often than the appliance
         device = self._appliance.get("device")
+        if device:
+            device = (
+                self._devices_coordinator.data["devices_by_id"].get(device.get("id"))
+                or device
+            )
         if device and "newest_events" in device:
             if "te" in device["newest_events"]:
                 return device["newest_events"]["te"]["val"]
@@ -184,48 +224,12 @@ class NatureRemoClimate(CoordinatorEntity, ClimateEntity):
     @property
     def min_temp(self):
         """Return the minimum temperature."""
-        if not self._appliance:
-            return 16
-
-        aircon = self._appliance.get("aircon", {})
-        range_data = aircon.get("range", {})
-        settings = self._appliance.get("settings", {})
-        current_mode = settings.get("mode", AC_MODE_AUTO)
-
-        # modes is a dict like {"cool": {"temp": [...], "vol": [...]}}
-        if "modes" in range_data and isinstance(range_data["modes"], dict):
-            mode_settings = range_data["modes"].get(current_mode, {})
-            temps = mode_settings.get("temp", [])
-            if temps:
-                try:
-                    return min(float(t) for t in temps if t)
-                except (ValueError, TypeError):
-                    pass
-
-        return 16
+        return self._temp_bounds[0]
 
     @property
     def max_temp(self):
         """Return the maximum temperature."""
-        if not self._appliance:
-            return 30
-
-        aircon = self._appliance.get("aircon", {})
-        range_data = aircon.get("range", {})
-        settings = self._appliance.get("settings", {})
-        current_mode = settings.get("mode", AC_MODE_AUTO)
-
-        # modes is a dict like {"cool": {"temp": [...], "vol": [...]}}
-        if "modes" in range_data and isinstance(range_data["modes"], dict):
-            mode_settings = range_data["modes"].get(current_mode, {})
-            temps = mode_settings.get("temp", [])
-            if temps:
-                try:
-                    return max(float(t) for t in temps if t)
-                except (ValueError, TypeError):
-                    pass
-
-        return 30
+        return self._temp_bounds[1]
 
     @property
     def fan_mode(self):
@@ -242,20 +246,7 @@ class NatureRemoClimate(CoordinatorEntity, ClimateEntity):
     @property
     def fan_modes(self):
         """Return the list of available fan modes."""
-        if not self._appliance:
-            return []
-
-        aircon = self._appliance.get("aircon", {})
-        range_data = aircon.get("range", {})
-        settings = self._appliance.get("settings", {})
-        current_mode = settings.get("mode", AC_MODE_AUTO)
-
-        # modes is a dict like {"cool": {"temp": [...], "vol": [...]}}
-        if "modes" in range_data and isinstance(range_data["modes"], dict):
-            mode_settings = range_data["modes"].get(current_mode, {})
-            return mode_settings.get("vol", [AC_FAN_AUTO])
-
-        return [AC_FAN_AUTO]
+        return self._fan_modes
 
     @property
     def swing_mode(self):
@@ -272,28 +263,33 @@ class NatureRemoClimate(CoordinatorEntity, ClimateEntity):
     @property
     def swing_modes(self):
         """Return the list of available swing modes."""
-        if not self._appliance:
-            return []
-
-        aircon = self._appliance.get("aircon", {})
-        range_data = aircon.get("range", {})
-        settings = self._appliance.get("settings", {})
-        current_mode = settings.get("mode", AC_MODE_AUTO)
+        return self._swing_modes
 
-        # modes is a dict like {"cool": {"temp": [...], "vol": [...], "dir": [...]}}
-        if "modes" in range_data and isinstance(range_data["modes"], dict):
-            mode_settings = range_data["modes"].get(current_mode, {})
-            return mode_settings.get("dir", [AC_SWING_AUTO])
+    @callback
+    def _async_apply_settings(self, **changes: str) -> None:
+        """Show settings the API accepted without waiting for a refresh."""
+        if not self._appliance:
+            return
 
-        return [AC_SWING_AUTO]
+        # The next scheduled refresh reconciles with the cloud state
+        settings = self._appliance.get("settings") or {}
+        settings.update(changes)
+        self._appliance["settings"] = settings
+        self._update_mode_ranges()
+        self.async_write_ha_state()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target HVAC mode."""
+        # Nature rate limits the API, don't resend the current state
+        if hvac_mode == self.hvac_mode:
+            return
+
         if hvac_mode == HVACMode.OFF:
             await self._api.update_aircon_settings(
                 self._appliance_id,
                 button="power-off",
             )
+            self._async_apply_settings(button="power-off")
         else:
             nature_mode = HA_TO_NATURE_MODE.get(hvac_mode)
             if nature_mode:
@@ -302,38 +298,46 @@ class NatureRemoClimate(CoordinatorEntity, ClimateEntity):
                     operation_mode=nature_mode,
                     button="",
                 )
-
-        await self.coordinator.async_request_refresh()
+                self._async_apply_settings(mode=nature_mode, button="")
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
-        if temperature is not None:
+        if temperature is not None and temperature != self.target_temperature:
             await self._api.update_aircon_settings(
                 self._appliance_id,
                 temperature=str(temperature),
             )
-            await self.coordinator.async_request_refresh()
+            self._async_apply_settings(temp=str(temperature))
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode."""
+        if fan_mode == self.fan_mode:
+            return
+
         await self._api.update_aircon_settings(
             self._appliance_id,
             air_volume=fan_mode,
         )
-        await self.coordinator.async_request_refresh()
+        self._async_apply_settings(vol=fan_mode)
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Set new target swing operation."""
+        if swing_mode == self.swing_mode:
+            return
+
         await self._api.update_aircon_settings(
             self._appliance_id,
             air_direction=swing_mode,
         )
-        await self.coordinator.async_request_refresh()
+        self._async_apply_settings(dir=swing_mode)
 
     async def async_turn_on(self) -> None:
         """Turn the entity on."""
-        settings = self._appliance.get("settings", {})
+        if self.hvac_mode != HVACMode.OFF:
+            return
+
+        settings = self._appliance.get("settings") or {}
         mode = settings.get("mode", AC_MODE_AUTO)
 
         await self._api.update_aircon_settings(
@@ -341,12 +345,15 @@ class NatureRemoClimate(CoordinatorEntity, ClimateEntity):
             operation_mode=mode,
             button="",
         )
-        await self.coordinator.async_request_refresh()
+        self._async_apply_settings(mode=mode, button="")
 
     async def async_turn_off(self) -> None:
         """Turn the entity off."""
+        if self.hvac_mode == HVACMode.OFF:
+            return
+
         await self._api.update_aircon_settings(
             self._appliance_id,
             button="power-off",
         )
-        await self.coordinator.async_request_refresh()
+        self._async_apply_settings(button="power-off")
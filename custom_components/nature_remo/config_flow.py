@@ -10,8 +10,14 @@ from homeassistant.const import CONF_ACCESS_TOKEN
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import NatureRemoAPI
-from .const import DOMAIN, ERROR_AUTH_INVALID, ERROR_CANNOT_CONNECT, ERROR_UNKNOWN
+from .const import (
+    API_BASE_URL,
+    API_VERSION,
+    DOMAIN,
+    ERROR_AUTH_INVALID,
+    ERROR_CANNOT_CONNECT,
+    ERROR_UNKNOWN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,10 +37,14 @@ class NatureRemoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             access_token = user_input[CONF_ACCESS_TOKEN]
 
             try:
-                # Validate the access token
+                # Validate the access token with a single users/me request
                 session = async_get_clientsession(self.hass)
-                api = NatureRemoAPI(access_token, session)
-                user_info = await api.get_user()
+                async with session.get(
+                    f"{API_BASE_URL}/{API_VERSION}/users/me",
+                    headers={"Authorization": f"Bearer {access_token}"},
+                ) as response:
+                    response.raise_for_status()
+                    user_info = await response.json()
 
                 # Set unique ID based on user nickname
                 await self.async_set_unique_id(user_info["nickname"])
@@ -10,7 +10,9 @@ API_BASE_URL = "https://api.nature.global"
 API_VERSION = "1"
 
 # Update interval
-UPDATE_INTERVAL = 60  # seconds
+DEVICES_UPDATE_INTERVAL = 30  # seconds, temperature/humidity/illuminance/motion
+APPLIANCES_UPDATE_INTERVAL = 300  # seconds, appliance settings and smart meters
+REQUEST_REFRESH_COOLDOWN = 1.0  # seconds, coalesces refreshes after commands
 
 # Platforms
 PLATFORMS = ["sensor", "climate", "remote", "switch", "light"]
@@ -21,6 +23,16 @@ APPLIANCE_TYPE_TV = "TV"
 APPLIANCE_TYPE_LIGHT = "LIGHT"
 APPLIANCE_TYPE_IR = "IR"
 
+# Substrings of IR signal names that turn an appliance on or off
+POWER_SIGNAL_KEYWORDS = {
+    "on": ("on", "オン"),
+    "off": ("off", "オフ"),
+}
+
+# Light buttons
+LIGHT_BUTTON_ON = "on"
+LIGHT_BUTTON_OFF = "off"
+
 # Device classes
 DEVICE_CLASS_TEMPERATURE = "temperature"
 DEVICE_CLASS_HUMIDITY = "humidity"
@@ -1,21 +1,51 @@
 """Support for Nature Remo lights."""
+import asyncio
 import logging
+from types import MappingProxyType
 from typing import Any
 
+import aiohttp
+
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ColorMode,
     LightEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import APPLIANCE_TYPE_LIGHT, DOMAIN
+from . import get_device_info
+from .const import (
+    APPLIANCE_TYPE_LIGHT,
+    DOMAIN,
+    LIGHT_BUTTON_OFF,
+    LIGHT_BUTTON_ON,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Read-only default for missing nested appliance data
+_EMPTY = MappingProxyType({})
+
+# Light buttons for each brightness level in percent
+BRIGHTNESS_BUTTONS = tuple(f"bright-{level}" for level in range(101))
+
+
+def _to_brightness(level: Any) -> int | None:
+    """Map a brightness level in percent to 0-255."""
+    # Brightness levels are usually numeric strings
+    if isinstance(level, str) and level.isdigit():
+        level = int(level)
+    elif not isinstance(level, int):
+        return None
+
+    if not level:
+        return None
+
+    return (level * 255) // 100
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,16 +53,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Nature Remo light from a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator = hass.data[DOMAIN][entry.entry_id]["appliances_coordinator"]
     api = hass.data[DOMAIN][entry.entry_id]["api"]
 
-    lights = []
-
-    for appliance in coordinator.data.get("appliances", []):
-        if appliance.get("type") == APPLIANCE_TYPE_LIGHT:
-            lights.append(
-                NatureRemoLight(coordinator, api, appliance["id"])
-            )
+    lights = [
+        NatureRemoLight(coordinator, api, appliance["id"])
+        for appliance in coordinator.data.get("appliances", ())
+        if appliance.get("type") == APPLIANCE_TYPE_LIGHT
+    ]
 
     async_add_entities(lights)
 
@@ -46,71 +74,46 @@ class NatureRemoLight(CoordinatorEntity, LightEntity):
     def __init__(self, coordinator, api, appliance_id):
         """Initialize the light."""
         super().__init__(coordinator)
-        self._api = api
+        self._send_light_signal = api.send_light_signal
         self._appliance_id = appliance_id
         self._attr_unique_id = appliance_id
+        # Background sends must reach the cloud in the order they were issued
+        self._send_lock = asyncio.Lock()
+        self._update_appliance()
 
-    @property
-    def _appliance(self):
-        """Return the appliance data."""
-        for appliance in self.coordinator.data.get("appliances", []):
-            if appliance["id"] == self._appliance_id:
-                return appliance
-        return None
-
-    @property
-    def name(self):
-        """Return the name of the light."""
-        if self._appliance:
-            return self._appliance.get("nickname", "Light")
-        return "Light"
-
-    @property
-    def device_info(self):
-        """Return device information."""
+        # The hub an appliance is paired with doesn't change, build this once
         if self._appliance:
-            device = self._appliance.get("device", {})
-            device_id = device.get("id")
-            device_name = device.get("name", "Unknown")
-            return {
-                "identifiers": {(DOMAIN, device_id)},
-                "name": device_name,
-                "manufacturer": "Nature",
-                "model": "Nature Remo",
-            }
-        return None
+            device = self._appliance.get("device", _EMPTY)
+            self._attr_device_info = get_device_info(
+                device.get("id"), device.get("name", "Unknown")
+            )
 
-    @property
-    def is_on(self):
-        """Return true if light is on."""
+    def _update_appliance(self) -> None:
+        """Resolve the appliance data shared by properties."""
+        self._appliance = self.coordinator.data["appliances_by_id"].get(
+            self._appliance_id
+        )
+        self._attr_name = (
+            self._appliance.get("nickname", "Light") if self._appliance else "Light"
+        )
+        self._update_light_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached appliance data."""
+        self._update_appliance()
+        super()._handle_coordinator_update()
+
+    def _update_light_state(self) -> None:
+        """Derive the power and brightness from the light state."""
         if not self._appliance:
-            return None
+            self._attr_is_on = None
+            self._attr_brightness = None
+            return
 
-        light_state = self._appliance.get("light", {}).get("state", {})
-        power = light_state.get("power")
-
-        return power == "on"
-
-    @property
-    def brightness(self):
-        """Return the brightness of the light."""
-        if not self._appliance:
-            return None
-
-        light_state = self._appliance.get("light", {}).get("state", {})
-        brightness = light_state.get("brightness")
-
-        if brightness:
-            # Map brightness level to 0-255 range
-            # Assuming brightness levels are numeric strings
-            try:
-                level = int(brightness)
-                # Adjust mapping based on your light's brightness range
-                return int((level / 100) * 255)
-            except (ValueError, TypeError):
-                pass
-
-        return None
+        light_state = self._appliance.get("light", _EMPTY).get("state", _EMPTY)
+        self._attr_is_on = light_state.get("power") == "on"
+        self._attr_brightness = _to_brightness(light_state.get("brightness"))
 
     @property
     def extra_state_attributes(self):
@@ -118,50 +121,71 @@ class NatureRemoLight(CoordinatorEntity, LightEntity):
         if not self._appliance:
             return {}
 
-        light_data = self._appliance.get("light", {})
-        buttons = light_data.get("buttons", [])
-        state = light_data.get("state", {})
+        state = self._appliance.get("light", _EMPTY).get("state", _EMPTY)
 
         return {
-            "available_buttons": [btn["name"] for btn in buttons],
+            "available_buttons": self.coordinator.data["light_buttons"].get(
+                self._appliance_id, ()
+            ),
             "last_button": state.get("last_button"),
         }
 
+    @callback
+    def _async_apply_state(self, **changes: str) -> None:
+        """Show the requested state without waiting for the API."""
+        if not self._appliance:
+            return
+
+        # The next scheduled refresh reconciles with the cloud state
+        light = self._appliance.setdefault("light", {})
+        state = light.get("state") or {}
+        state.update(changes)
+        light["state"] = state
+        self._update_light_state()
+        self.async_write_ha_state()
+
+    async def _async_send_button(self, button: str) -> None:
+        """Send a button, resyncing with the cloud if that fails."""
+        async with self._send_lock:
+            try:
+                await self._send_light_signal(self._appliance_id, button=button)
+            except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+                _LOGGER.error("Failed to send %s to %s: %s", button, self.name, err)
+                # Replace the optimistic state with the actual one
+                await self.coordinator.async_request_refresh()
+                return
+
+        _LOGGER.debug("Sent %s to %s", button, self.name)
+
+    @callback
+    def _async_schedule_send(self, button: str) -> None:
+        """Send a button without holding up the service call."""
+        # Tied to the config entry so pending sends are cancelled on unload
+        self.coordinator.config_entry.async_create_background_task(
+            self.hass,
+            self._async_send_button(button),
+            f"{DOMAIN} send {button} to {self._appliance_id}",
+        )
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
-        try:
-            # Check if brightness is provided
-            if ATTR_BRIGHTNESS in kwargs:
-                brightness = kwargs[ATTR_BRIGHTNESS]
-                # Map 0-255 to light's brightness range
-                brightness_level = str(int((brightness / 255) * 100))
-
-                # Try to set brightness if supported
-                await self._api.send_light_signal(
-                    self._appliance_id,
-                    button=f"bright-{brightness_level}",
-                )
-            else:
-                await self._api.send_light_signal(
-                    self._appliance_id,
-                    button="on",
-                )
-
-            await self.coordinator.async_request_refresh()
-            _LOGGER.info("Turned on %s", self.name)
-
-        except Exception as err:
-            _LOGGER.error("Failed to turn on %s: %s", self.name, err)
+        # Check if brightness is provided
+        if ATTR_BRIGHTNESS in kwargs:
+            # Map 0-255 to light's brightness range
+            brightness_level = (kwargs[ATTR_BRIGHTNESS] * 100) // 255
+            button = BRIGHTNESS_BUTTONS[brightness_level]
+            self._async_apply_state(
+                power="on",
+                brightness=str(brightness_level),
+                last_button=button,
+            )
+        else:
+            button = LIGHT_BUTTON_ON
+            self._async_apply_state(power="on", last_button=button)
+
+        self._async_schedule_send(button)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
-        try:
-            await self._api.send_light_signal(
-                self._appliance_id,
-                button="off",
-            )
-            await self.coordinator.async_request_refresh()
-            _LOGGER.info("Turned off %s", self.name)
-
-        except Exception as err:
-            _LOGGER.error("Failed to turn off %s: %s", self.name, err)
+        self._async_apply_state(power="off", last_button=LIGHT_BUTTON_OFF)
+        self._async_schedule_send(LIGHT_BUTTON_OFF)
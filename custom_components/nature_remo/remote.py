@@ -4,10 +4,11 @@ from typing import Any, Iterable
 
 from homeassistant.components.remote import RemoteEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import get_device_info
 from .const import APPLIANCE_TYPE_IR, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -19,7 +20,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Nature Remo remote from a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator = hass.data[DOMAIN][entry.entry_id]["appliances_coordinator"]
     api = hass.data[DOMAIN][entry.entry_id]["api"]
 
     remotes = []
@@ -38,48 +39,45 @@ async def async_setup_entry(
 class NatureRemoRemote(CoordinatorEntity, RemoteEntity):
     """Representation of a Nature Remo remote control."""
 
+    # IR remotes are always "on" (ready to send signals)
+    _attr_is_on = True
+
     def __init__(self, coordinator, api, appliance_id):
         """Initialize the remote."""
         super().__init__(coordinator)
         self._api = api
         self._appliance_id = appliance_id
         self._attr_unique_id = f"{appliance_id}_remote"
+        self._last_snapshot: tuple | None = None
+        self._update_attributes()
 
     @property
     def _appliance(self):
         """Return the appliance data."""
-        for appliance in self.coordinator.data.get("appliances", []):
-            if appliance["id"] == self._appliance_id:
-                return appliance
-        return None
-
-    @property
-    def name(self):
-        """Return the name of the remote."""
-        if self._appliance:
-            return self._appliance.get("nickname", "Remote Control")
-        return "Remote Control"
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        if self._appliance:
-            device = self._appliance.get("device", {})
-            device_id = device.get("id")
-            device_name = device.get("name", "Unknown")
-            return {
-                "identifiers": {(DOMAIN, device_id)},
-                "name": device_name,
-                "manufacturer": "Nature",
-                "model": "Nature Remo",
-            }
-        return None
-
-    @property
-    def is_on(self):
-        """Return true if remote is on."""
-        # IR remotes are always "on" (ready to send signals)
-        return True
+        return self.coordinator.data["appliances_by_id"].get(self._appliance_id)
+
+    def _update_attributes(self) -> None:
+        """Set the name and device info from the appliance data."""
+        appliance = self._appliance
+        if appliance:
+            device = appliance.get("device", {})
+            self._attr_name = appliance.get("nickname", "Remote Control")
+            self._attr_device_info = get_device_info(
+                device.get("id"), device.get("name", "Unknown")
+            )
+        else:
+            self._attr_name = "Remote Control"
+            self._attr_device_info = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up appliance changes and write the state if anything changed."""
+        snapshot = (self.available, self._appliance)
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+        self._update_attributes()
+        super()._handle_coordinator_update()
 
     @property
     def extra_state_attributes(self):
@@ -97,11 +95,11 @@ class NatureRemoRemote(CoordinatorEntity, RemoteEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the remote on (no-op for IR remotes)."""
-        _LOGGER.info("Turn on called for %s (no-op)", self.name)
+        _LOGGER.debug("Turn on called for %s (no-op)", self.name)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the remote off (no-op for IR remotes)."""
-        _LOGGER.info("Turn off called for %s (no-op)", self.name)
+        _LOGGER.debug("Turn off called for %s (no-op)", self.name)
 
     async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
         """Send a command to the remote."""
@@ -109,37 +107,40 @@ class NatureRemoRemote(CoordinatorEntity, RemoteEntity):
             _LOGGER.error("Appliance not found for remote %s", self._appliance_id)
             return
 
-        signals = self._appliance.get("signals", [])
+        signals_by_name = self.coordinator.data["signals_by_name"].get(
+            self._appliance_id, {}
+        )
 
+        # Resolve every command before sending anything
+        resolved = []
         for cmd in command:
-            # Find the signal by name
-            signal_id = None
-            for signal in signals:
-                if signal["name"] == cmd:
-                    signal_id = signal["id"]
-                    break
-
+            signal_id = signals_by_name.get(cmd)
             if signal_id:
-                try:
-                    await self._api.send_signal(signal_id)
-                    _LOGGER.info(
-                        "Sent command '%s' (signal_id: %s) for %s",
-                        cmd,
-                        signal_id,
-                        self.name,
-                    )
-                except Exception as err:
-                    _LOGGER.error(
-                        "Failed to send command '%s' for %s: %s",
-                        cmd,
-                        self.name,
-                        err,
-                    )
+                resolved.append((cmd, signal_id))
             else:
                 _LOGGER.warning(
                     "Command '%s' not found in signals for %s", cmd, self.name
                 )
 
+        # IR signals are sent one after another, a sequence like
+        # "menu, down, ok" is only meaningful in order
+        for cmd, signal_id in resolved:
+            try:
+                await self._api.send_signal(signal_id)
+                _LOGGER.info(
+                    "Sent command '%s' (signal_id: %s) for %s",
+                    cmd,
+                    signal_id,
+                    self.name,
+                )
+            except Exception as err:
+                _LOGGER.error(
+                    "Failed to send command '%s' for %s: %s",
+                    cmd,
+                    self.name,
+                    err,
+                )
+
     async def async_learn_command(self, **kwargs: Any) -> None:
         """Learn a command from the remote."""
         _LOGGER.warning(
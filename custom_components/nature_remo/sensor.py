@@ -14,10 +14,11 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import get_device_info
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,53 +30,42 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Nature Remo sensor from a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    devices_coordinator = hass.data[DOMAIN][entry.entry_id]["devices_coordinator"]
+    appliances_coordinator = hass.data[DOMAIN][entry.entry_id][
+        "appliances_coordinator"
+    ]
 
     sensors = []
 
     # Add device sensors (temperature, humidity, illuminance, motion)
-    for device in coordinator.data.get("devices", []):
+    for device in devices_coordinator.data.get("devices", []):
         device_id = device["id"]
         device_name = device["name"]
+        events = device.get("newest_events") or {}
 
-        # Temperature sensor
-        if "newest_events" in device and "te" in device["newest_events"]:
-            sensors.append(
-                NatureRemoTemperatureSensor(coordinator, device_id, device_name)
-            )
+        for event_key, sensor_class in DEVICE_SENSORS:
+            if event_key in events:
+                sensors.append(
+                    sensor_class(devices_coordinator, device_id, device_name)
+                )
 
-        # Humidity sensor
-        if "newest_events" in device and "hu" in device["newest_events"]:
-            sensors.append(
-                NatureRemoHumiditySensor(coordinator, device_id, device_name)
-            )
+    # Add smart meter sensors
+    for appliance in appliances_coordinator.data.get("smart_meters", []):
+        appliance_id = appliance["id"]
+        appliance_name = appliance["nickname"]
 
-        # Illuminance sensor
-        if "newest_events" in device and "il" in device["newest_events"]:
+        # Instantaneous power sensor
+        if "smart_meter" in appliance:
             sensors.append(
-                NatureRemoIlluminanceSensor(coordinator, device_id, device_name)
+                NatureRemoPowerSensor(
+                    appliances_coordinator, appliance_id, appliance_name
+                )
             )
-
-        # Motion sensor
-        if "newest_events" in device and "mo" in device["newest_events"]:
             sensors.append(
-                NatureRemoMotionSensor(coordinator, device_id, device_name)
-            )
-
-    # Add smart meter sensors
-    for appliance in coordinator.data.get("appliances", []):
-        if appliance.get("type") == "EL_SMART_METER":
-            appliance_id = appliance["id"]
-            appliance_name = appliance["nickname"]
-
-            # Instantaneous power sensor
-            if "smart_meter" in appliance:
-                sensors.append(
-                    NatureRemoPowerSensor(coordinator, appliance_id, appliance_name)
-                )
-                sensors.append(
-                    NatureRemoEnergySensor(coordinator, appliance_id, appliance_name)
+                NatureRemoEnergySensor(
+                    appliances_coordinator, appliance_id, appliance_name
                 )
+            )
 
     async_add_entities(sensors)
 
@@ -88,16 +78,17 @@ class NatureRemoSensorBase(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._device_id = device_id
         self._device_name = device_name
+        self._attr_device_info = get_device_info(device_id, device_name)
+        self._last_snapshot: tuple | None = None
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-            "name": self._device_name,
-            "manufacturer": "Nature",
-            "model": "Nature Remo",
-        }
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when this sensor's reading changed."""
+        snapshot = (self.available, self.native_value)
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+        super()._handle_coordinator_update()
 
 
 class NatureRemoTemperatureSensor(NatureRemoSensorBase):
@@ -116,10 +107,9 @@ class NatureRemoTemperatureSensor(NatureRemoSensorBase):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        for device in self.coordinator.data.get("devices", []):
-            if device["id"] == self._device_id:
-                if "newest_events" in device and "te" in device["newest_events"]:
-                    return device["newest_events"]["te"]["val"]
+        device = self.coordinator.data["devices_by_id"].get(self._device_id)
+        if device and "newest_events" in device and "te" in device["newest_events"]:
+            return device["newest_events"]["te"]["val"]
         return None
 
 
@@ -139,10 +129,9 @@ class NatureRemoHumiditySensor(NatureRemoSensorBase):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        for device in self.coordinator.data.get("devices", []):
-            if device["id"] == self._device_id:
-                if "newest_events" in device and "hu" in device["newest_events"]:
-                    return device["newest_events"]["hu"]["val"]
+        device = self.coordinator.data["devices_by_id"].get(self._device_id)
+        if device and "newest_events" in device and "hu" in device["newest_events"]:
+            return device["newest_events"]["hu"]["val"]
         return None
 
 
@@ -162,10 +151,9 @@ class NatureRemoIlluminanceSensor(NatureRemoSensorBase):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        for device in self.coordinator.data.get("devices", []):
-            if device["id"] == self._device_id:
-                if "newest_events" in device and "il" in device["newest_events"]:
-                    return device["newest_events"]["il"]["val"]
+        device = self.coordinator.data["devices_by_id"].get(self._device_id)
+        if device and "newest_events" in device and "il" in device["newest_events"]:
+            return device["newest_events"]["il"]["val"]
         return None
 
 
@@ -183,10 +171,9 @@ class NatureRemoMotionSensor(NatureRemoSensorBase):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        for device in self.coordinator.data.get("devices", []):
-            if device["id"] == self._device_id:
-                if "newest_events" in device and "mo" in device["newest_events"]:
-                    return device["newest_events"]["mo"]["created_at"]
+        device = self.coordinator.data["devices_by_id"].get(self._device_id)
+        if device and "newest_events" in device and "mo" in device["newest_events"]:
+            return device["newest_events"]["mo"]["created_at"]
         return None
 
 
@@ -206,14 +193,10 @@ class NatureRemoPowerSensor(NatureRemoSensorBase):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        for appliance in self.coordinator.data.get("appliances", []):
-            if appliance["id"] == self._device_id:
-                if "smart_meter" in appliance:
-                    smart_meter = appliance["smart_meter"]
-                    if "echonetlite_properties" in smart_meter:
-                        for prop in smart_meter["echonetlite_properties"]:
-                            if prop["epc"] == 231:  # Instantaneous power
-                                return prop.get("val")
+        props = self.coordinator.data["smart_meter_props"].get(self._device_id, {})
+        prop = props.get(231)  # Instantaneous power
+        if prop:
+            return prop.get("val")
         return None
 
 
@@ -233,15 +216,20 @@ class NatureRemoEnergySensor(NatureRemoSensorBase):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        for appliance in self.coordinator.data.get("appliances", []):
-            if appliance["id"] == self._device_id:
-                if "smart_meter" in appliance:
-                    smart_meter = appliance["smart_meter"]
-                    if "echonetlite_properties" in smart_meter:
-                        for prop in smart_meter["echonetlite_properties"]:
-                            if prop["epc"] == 224:  # Cumulative energy
-                                val = prop.get("val")
-                                coefficient = smart_meter.get("coefficient", 1)
-                                if val is not None:
-                                    return val * coefficient
+        props = self.coordinator.data["smart_meter_props"].get(self._device_id, {})
+        prop = props.get(224)  # Cumulative energy
+        if prop:
+            val = prop.get("val")
+            if val is not None:
+                appliance = self.coordinator.data["appliances_by_id"][self._device_id]
+                return val * appliance["smart_meter"].get("coefficient", 1)
         return None
+
+
+# Device sensor classes by newest_events key
+DEVICE_SENSORS = (
+    ("te", NatureRemoTemperatureSensor),
+    ("hu", NatureRemoHumiditySensor),
+    ("il", NatureRemoIlluminanceSensor),
+    ("mo", NatureRemoMotionSensor),
+)
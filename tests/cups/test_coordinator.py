@@ -0,0 +1,149 @@
+"""Tests for the CUPS data update coordinator."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pyipp import Printer
+import pytest
+
+from custom_components.cups import CUPSDataUpdateCoordinator
+from custom_components.cups.const import (
+    DOMAIN,
+    UPDATE_INTERVAL,
+)
+from custom_components.cups.ipp_operations import IPPOperationError
+
+ACTIVE_INTERVAL = 7
+IDLE_INTERVAL = 90
+
+PRINTER_ATTRIBUTES = {
+    "printer-name": "office",
+    "printer-make-and-model": "HP LaserJet Pro M404",
+    "printer-firmware-string-version": "002.2049A",
+    "printer-uri-supported": ["ipp://printer.local:631/ipp/print"],
+    "printer-state": 3,
+    "printer-up-time": 1234,
+}
+
+
+def _transport_error() -> IPPOperationError:
+    """Return the error IPPOperations raises for a request timeout."""
+    err = IPPOperationError("Timeout")
+    err.__cause__ = asyncio.TimeoutError()
+    return err
+
+
+def _coordinator(printer: Printer) -> CUPSDataUpdateCoordinator:
+    """Return a coordinator whose first refresh fetches printer."""
+    ipp = MagicMock()
+    ipp.printer = AsyncMock(return_value=printer)
+    ipp_ops = MagicMock()
+    ipp_ops.get_active_job_count = AsyncMock(return_value=0)
+
+    coordinator = CUPSDataUpdateCoordinator(
+        MagicMock(),
+        ipp,
+        ipp_ops,
+        active_interval=ACTIVE_INTERVAL,
+        idle_interval=IDLE_INTERVAL,
+    )
+    coordinator.config_entry = MagicMock(entry_id="entry", title="Office")
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_device_info_from_parsed_printer() -> None:
+    """Test the device info is built from the fields pyipp parses."""
+    coordinator = _coordinator(Printer.from_dict(PRINTER_ATTRIBUTES))
+
+    await coordinator._async_update_data()
+
+    assert coordinator.device_info_cache == {
+        "identifiers": {(DOMAIN, "entry")},
+        "name": "HP LaserJet Pro M404",
+        "manufacturer": "HP",
+        "model": "LaserJet Pro M404",
+        "sw_version": "002.2049A",
+        "configuration_url": "ipp://printer.local:631/ipp/print",
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("printer_state", "expected_interval"),
+    # IPP printer-state values: processing, idle and stopped
+    [
+        (4, ACTIVE_INTERVAL),
+        (3, IDLE_INTERVAL),
+        (5, UPDATE_INTERVAL),
+    ],
+)
+async def test_update_interval_follows_printer_state(
+    printer_state: int, expected_interval: int
+) -> None:
+    """Test the polling interval follows the state pyipp parsed."""
+    printer = Printer.from_dict(
+        {**PRINTER_ATTRIBUTES, "printer-state": printer_state}
+    )
+    coordinator = _coordinator(printer)
+
+    data = await coordinator._async_update_data()
+
+    assert data["printer"].state.printer_state == printer.state.printer_state
+    assert coordinator.update_interval == timedelta(seconds=expected_interval)
+
+
+@pytest.mark.asyncio
+async def test_event_listener_keeps_or_cancels_subscription() -> None:
+    """Test transport errors keep the subscription and IPP errors cancel it."""
+    ipp_ops = MagicMock()
+    ipp_ops.create_printer_subscription = AsyncMock(
+        side_effect=[1, asyncio.CancelledError]
+    )
+    ipp_ops.get_notifications = AsyncMock(
+        side_effect=[
+            _transport_error(),
+            IPPOperationError("Bad request", status_code=0x0400),
+        ]
+    )
+    ipp_ops.cancel_subscription = AsyncMock(return_value=True)
+
+    coordinator = CUPSDataUpdateCoordinator(MagicMock(), MagicMock(), ipp_ops)
+
+    with patch("custom_components.cups.asyncio.sleep", AsyncMock()), pytest.raises(
+        asyncio.CancelledError
+    ):
+        await coordinator._async_listen_for_events()
+
+    assert [call.args[0] for call in ipp_ops.get_notifications.call_args_list] == [
+        1,
+        1,
+    ]
+    ipp_ops.cancel_subscription.assert_awaited_once_with(1)
+    assert coordinator._subscription_id is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("subscribe_errors", "expected_attempts"),
+    [
+        # The server answered without an ID, asking again won't help
+        ([IPPOperationError("No subscription ID in response", status_code=0)], 1),
+        # Transport errors are retried
+        ([_transport_error(), IPPOperationError("Not supported", 0x0501)], 2),
+    ],
+)
+async def test_event_listener_subscribe_errors(
+    subscribe_errors: list[IPPOperationError], expected_attempts: int
+) -> None:
+    """Test only HTTP errors and timeouts retry the subscription."""
+    ipp_ops = MagicMock()
+    ipp_ops.create_printer_subscription = AsyncMock(side_effect=subscribe_errors)
+
+    coordinator = CUPSDataUpdateCoordinator(MagicMock(), MagicMock(), ipp_ops)
+
+    with patch("custom_components.cups.asyncio.sleep", AsyncMock()):
+        await coordinator._async_listen_for_events()
+
+    assert ipp_ops.create_printer_subscription.await_count == expected_attempts
+    assert coordinator._subscription_id is None
@@ -0,0 +1,50 @@
+"""Tests for the CUPS sensor and binary sensor states."""
+from unittest.mock import MagicMock
+
+from pyipp import Printer
+import pytest
+
+from custom_components.cups.binary_sensor import CUPSConnectivitySensor
+from custom_components.cups.sensor import CUPSPrinterStateSensor
+
+
+def _coordinator(**attributes) -> MagicMock:
+    """Return a coordinator holding a printer parsed by pyipp."""
+    printer = Printer.from_dict({"printer-name": "office", **attributes})
+    return MagicMock(data={"printer": printer, "active_jobs": 0})
+
+
+@pytest.mark.parametrize(
+    ("printer_state", "expected"),
+    [(3, "idle"), (4, "printing"), (5, "stopped")],
+)
+def test_status_sensor_state(printer_state: int, expected: str) -> None:
+    """Test the status sensor reports the printer state pyipp parsed."""
+    sensor = CUPSPrinterStateSensor(
+        _coordinator(**{"printer-state": printer_state}),
+        MagicMock(entry_id="entry"),
+    )
+
+    assert sensor.native_value == expected
+
+
+@pytest.mark.parametrize(
+    ("printer_state", "reasons", "expected"),
+    [
+        (3, "none", True),
+        (5, "paused", True),
+        (5, "offline-report", False),
+    ],
+)
+def test_connectivity_sensor_state(
+    printer_state: int, reasons: str, expected: bool
+) -> None:
+    """Test a stopped printer is offline only for connectivity reasons."""
+    sensor = CUPSConnectivitySensor(
+        _coordinator(
+            **{"printer-state": printer_state, "printer-state-reasons": reasons}
+        ),
+        MagicMock(entry_id="entry"),
+    )
+
+    assert sensor.is_on is expected
@@ -0,0 +1,26 @@
+"""Tests for the CUPS IPP operations."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.cups.ipp_operations import IPPOperationError, IPPOperations
+
+
+@pytest.mark.asyncio
+async def test_subscription_without_id_reports_status() -> None:
+    """Test a response without a subscription ID carries its status code."""
+    ipp_ops = IPPOperations(
+        session=MagicMock(),
+        host="printer.local",
+        port=631,
+        base_path="/ipp/print",
+        tls=False,
+    )
+    ipp_ops._send_ipp_request = AsyncMock(
+        return_value={"status_code": 0x0000, "groups": []}
+    )
+
+    with pytest.raises(IPPOperationError) as exc_info:
+        await ipp_ops.create_printer_subscription(["printer-state-changed"], 60)
+
+    assert exc_info.value.status_code == 0x0000